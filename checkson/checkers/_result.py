@@ -0,0 +1,31 @@
+"""
+Result type shared by all availability checkers.
+"""
+from typing import NamedTuple
+
+# Result categories, stored as small ints so tallying is a plain Counter
+AVAILABLE = 0
+TAKEN = 1
+ERROR = 2
+
+
+class Result(NamedTuple):
+    """Outcome of a single availability check."""
+    name: str
+    status: str
+    cat: int  # AVAILABLE, TAKEN or ERROR
+    
+    @property
+    def available(self) -> bool:
+        """Whether the name is free to register."""
+        return self.cat == AVAILABLE
+    
+    @property
+    def taken(self) -> bool:
+        """Whether the name is already in use."""
+        return self.cat == TAKEN
+    
+    @property
+    def error(self) -> bool:
+        """Whether the check could not determine availability."""
+        return self.cat == ERROR
\ No newline at end of file
@@ -2,18 +2,115 @@
 Domain name availability checker.
 """
 import socket
-from typing import Dict, List, Any
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, Union
 import asyncio
 
-from ..utils.terminal import format_status
-from ..utils.http import AsyncRequestManager
+import aiodns
+
+from ..utils.config import (
+    DNS_CACHE_TTL,
+    DNS_NEGATIVE_CACHE_TTL,
+    DNS_CACHE_SIZE,
+    MAX_CONCURRENT_REQUESTS
+)
+from ..utils.dns import resolve, resolve_many
+from ._result import AVAILABLE, ERROR, TAKEN, Result
+
+# LRU cache of resolution outcomes: domain -> (expires_at, taken)
+_DNS_CACHE: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+
+
+# Lookups currently in progress: domain -> future shared by all waiters
+_INFLIGHT: Dict[str, "asyncio.Future[Result]"] = {}
+
+# getaddrinfo errors that mean the name does not exist; others (EAI_AGAIN when
+# offline, EAI_FAIL, ...) say nothing about availability. EAI_NODATA isn't
+# defined on every platform
+_NOT_FOUND_GAIERRORS = frozenset(
+    code for code in (socket.EAI_NONAME, getattr(socket, "EAI_NODATA", None)) if code is not None
+)
+
+
+def _cache_get(domain: str) -> Optional[bool]:
+    """
+    Look up a cached resolution outcome.
+    
+    Args:
+        domain: The domain name to look up
+        
+    Returns:
+        True if the domain resolved, False for NXDOMAIN, None on a miss
+    """
+    entry = _DNS_CACHE.get(domain)
+    if entry is None:
+        return None
+    
+    expires_at, taken = entry
+    if time.monotonic() >= expires_at:
+        del _DNS_CACHE[domain]
+        return None
+    
+    _DNS_CACHE.move_to_end(domain)
+    return taken
+
+
+def _cache_put(domain: str, taken: bool) -> None:
+    """
+    Store a resolution outcome, using a shorter TTL for negative results.
+    
+    Args:
+        domain: The domain name that was resolved
+        taken: Whether the domain resolved
+    """
+    ttl = DNS_CACHE_TTL if taken else DNS_NEGATIVE_CACHE_TTL
+    if ttl <= 0:
+        return
+    
+    _DNS_CACHE[domain] = (time.monotonic() + ttl, taken)
+    _DNS_CACHE.move_to_end(domain)
+    while len(_DNS_CACHE) > DNS_CACHE_SIZE:
+        _DNS_CACHE.popitem(last=False)
+
+
+def _resolved_result(domain: str, taken: bool) -> Result:
+    """Build the result for a domain that did or did not resolve."""
+    if taken:
+        return Result(name=domain, status="❌ Taken", cat=TAKEN)
+    return Result(name=domain, status="✅ Available", cat=AVAILABLE)
+
+
+def _error_result(domain: str, message: str) -> Result:
+    """Build the result for a domain whose lookup failed."""
+    return Result(name=domain, status=f"⚠️ Error ({message})", cat=ERROR)
+
+
+def _lookup_result(domain: str, outcome: Union[str, None, aiodns.error.DNSError]) -> Result:
+    """
+    Turn a resolver outcome into a result, caching successful lookups.
+    
+    Args:
+        domain: The domain name that was resolved
+        outcome: The resolved address, None for NXDOMAIN, or the resolver error
+        
+    Returns:
+        Result of the check
+    """
+    if isinstance(outcome, aiodns.error.DNSError):
+        # Other resolver errors (timeouts, refused queries, ...)
+        return _error_result(domain, outcome.args[1] if len(outcome.args) > 1 else str(outcome))
+    
+    taken = outcome is not None
+    _cache_put(domain, taken)
+    return _resolved_result(domain, taken)
 
 
 class DomainChecker:
     """Class for checking domain name availability."""
     
     @staticmethod
-    def check_domain(domain: str) -> Dict[str, Any]:
+    def check_domain(domain: str) -> Result:
         """
         Basic check if a domain is available by attempting DNS resolution.
         Note: This is a simple check and not 100% reliable for domain availability.
@@ -22,78 +119,127 @@ class DomainChecker:
             domain: The domain name to check
             
         Returns:
-            Dict containing the domain and status
+            Result containing the domain and status
         """
+        cached = _cache_get(domain)
+        if cached is not None:
+            return _resolved_result(domain, cached)
+        
         try:
-            # Try to resolve the domain
-            socket.gethostbyname(domain)
+            # Try to resolve the domain (IPv4 only, so a single A query is sent)
+            socket.getaddrinfo(
+                domain,
+                None,
+                socket.AF_INET,
+                socket.SOCK_STREAM,
+                0,
+                socket.AI_ADDRCONFIG | socket.AI_NUMERICSERV
+            )
             # If we get here, the domain exists
-            return {
-                "name": domain,
-                "status": "❌ Taken",
-                "available": False,
-                "taken": True,
-                "error": False
-            }
-        except socket.gaierror:
-            # If we get a DNS error, the domain likely doesn't exist
-            return {
-                "name": domain,
-                "status": "✅ Available",
-                "available": True,
-                "taken": False,
-                "error": False
-            }
+            taken = True
+        except socket.gaierror as e:
+            if e.errno not in _NOT_FOUND_GAIERRORS:
+                # Lookup failures other than a missing name aren't cached
+                return _error_result(domain, str(e.strerror or e))
+            # The name doesn't resolve, so the domain likely isn't registered
+            taken = False
         except Exception as e:
             # Other errors
-            return {
-                "name": domain,
-                "status": f"⚠️ Error ({str(e)})",
-                "available": False,
-                "taken": False,
-                "error": True
-            }
+            return _error_result(domain, str(e))
+        
+        _cache_put(domain, taken)
+        return _resolved_result(domain, taken)
     
     @staticmethod
-    async def check_domain_async(domain: str) -> Dict[str, Any]:
+    async def check_domain_async(domain: str) -> Result:
         """
-        Async wrapper for domain check.
+        Check a domain asynchronously using c-ares instead of the thread pool.
+        
+        Concurrent checks of the same domain share a single lookup.
         
         Args:
             domain: The domain name to check
             
         Returns:
-            Dict containing check results
+            Result of the check
+        """
+        cached = _cache_get(domain)
+        if cached is not None:
+            return _resolved_result(domain, cached)
+        
+        pending = _INFLIGHT.get(domain)
+        if pending is None:
+            pending = asyncio.ensure_future(DomainChecker._lookup_async(domain))
+            _INFLIGHT[domain] = pending
+            pending.add_done_callback(lambda _: _INFLIGHT.pop(domain, None))
+        
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(pending)
+    
+    @staticmethod
+    async def _lookup_async(domain: str) -> Result:
+        """
+        Resolve a domain with c-ares and cache the outcome.
+        
+        Args:
+            domain: The domain name to resolve
+            
+        Returns:
+            Result of the check
         """
-        return await asyncio.to_thread(DomainChecker.check_domain, domain)
+        try:
+            outcome: Union[str, None, aiodns.error.DNSError] = await resolve(domain)
+        except aiodns.error.DNSError as e:
+            outcome = e
+        
+        return _lookup_result(domain, outcome)
     
     @staticmethod
-    async def check_domains_async(domains: List[str]) -> List[Dict[str, Any]]:
+    async def check_domains_async(
+        domains: List[str],
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> List[Result]:
         """
-        Check multiple domains concurrently.
+        Check multiple domains, resolving every uncached name in one batch.
         
         Args:
             domains: List of domain names to check
+            max_concurrent: Maximum number of lookups in flight at once
+            on_progress: Optional callback receiving the number of newly finished checks
             
         Returns:
-            List of dictionaries with check results
+            List of check results
         """
-        # Create tasks for each domain
-        tasks = [DomainChecker.check_domain_async(domain) for domain in domains]
+        # Serve what we can from the cache, then resolve the rest in one batch
+        cached = {domain: _cache_get(domain) for domain in dict.fromkeys(domains)}
+        misses = [domain for domain, taken in cached.items() if taken is None]
+        if on_progress and len(misses) < len(cached):
+            on_progress(len(cached) - len(misses))
+        resolved = await resolve_many(misses, max_concurrent, on_progress) if misses else {}
         
-        # Run all tasks concurrently
-        return await asyncio.gather(*tasks)
-
+        outcomes: Dict[str, Result] = {}
+        for domain, taken in cached.items():
+            if taken is None:
+                outcomes[domain] = _lookup_result(domain, resolved[domain])
+            else:
+                outcomes[domain] = _resolved_result(domain, taken)
+        
+        return [outcomes[domain] for domain in domains]
 
 # Exported compatibility functions
-def check_domain(domain: str) -> Dict[str, Any]:
+def check_domain(domain: str) -> Result:
     """Check domain availability (wrapper for DomainChecker.check_domain)."""
     return DomainChecker.check_domain(domain)
 
-async def check_domain_async(domain: str) -> Dict[str, Any]:
+async def check_domain_async(domain: str) -> Result:
     """Async domain check (wrapper for DomainChecker.check_domain_async)."""
     return await DomainChecker.check_domain_async(domain)
 
-async def check_domains_async(domains: List[str]) -> List[Dict[str, Any]]:
+async def check_domains_async(
+    domains: List[str],
+    max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    on_progress: Optional[Callable[[int], None]] = None
+) -> List[Result]:
     """Check multiple domains (wrapper for DomainChecker.check_domains_async)."""
-    return await DomainChecker.check_domains_async(domains) 
\ No newline at end of file
+    return await DomainChecker.check_domains_async(domains, max_concurrent, on_progress) 
\ No newline at end of file
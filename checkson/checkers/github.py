@@ -1,19 +1,97 @@
 """
 GitHub availability checker for usernames and repositories.
 """
-import asyncio
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Callable, Optional
 
 from ..utils.config import GITHUB_API_URL
 from ..utils.http import HTTPClient, AsyncRequestManager
-from ..utils.terminal import format_status
+from ..utils.terminal import TerminalUI
+from ._result import AVAILABLE, ERROR, TAKEN, Result
+
+# Endpoint prefixes, so per-name URLs are a single string concatenation
+_USERS_PREFIX = f"{GITHUB_API_URL}/users/"
+_REPOS_PREFIX = f"{GITHUB_API_URL}/repos/"
+
+# Availability only depends on the status code, so skip downloading the body
+_PROBE_METHOD = "HEAD"
+
+# Result category for each definitive API status code; anything else is an error
+_STATUS_CATEGORIES: Dict[int, int] = {404: AVAILABLE, 200: TAKEN}
+
+async def _probe_status(url: str, request_manager: Optional[AsyncRequestManager]) -> int:
+    """
+    Probe a GitHub API URL and return its status code.
+    
+    Args:
+        url: The API URL to probe
+        request_manager: Manager to send the request with; without one, a
+            short-lived manager is opened and closed around the request
+        
+    Returns:
+        HTTP status code of the response
+    """
+    if request_manager is not None:
+        _, status_code, _ = await request_manager.get(url, _PROBE_METHOD)
+        return status_code
+    
+    async with AsyncRequestManager() as manager:
+        _, status_code, _ = await manager.get(url, _PROBE_METHOD)
+    return status_code
+
+
+async def _batch_probe(
+    request_manager: Optional[AsyncRequestManager],
+    urls: List[str],
+    on_progress: Optional[Callable[[int], None]] = None
+) -> List[Tuple[str, int, Dict[str, Any]]]:
+    """
+    Probe URLs concurrently, reporting progress as each response arrives.
+    
+    Args:
+        request_manager: Manager to issue requests with; without one, a
+            pooled manager is opened for the batch and closed when it finishes
+        urls: List of URLs to request
+        on_progress: Optional callback receiving the number of newly finished requests
+        
+    Returns:
+        List of (url, status_code, response_data) tuples in the order of urls
+    """
+    if request_manager is None:
+        async with AsyncRequestManager() as manager:
+            return await _batch_probe(manager, urls, on_progress)
+    
+    by_url: Dict[str, Tuple[str, int, Dict[str, Any]]] = {}
+    async for response in request_manager.batch_get_iter(urls, _PROBE_METHOD):
+        by_url[response[0]] = response
+        if on_progress:
+            on_progress(1)
+    return [by_url[url] for url in urls]
+
+
+def _build_result(name: str, status_code: int, service_type: str) -> Result:
+    """
+    Build a check result from a GitHub API status code.
+    
+    Args:
+        name: The name that was checked
+        status_code: HTTP status code returned by the API
+        service_type: Kind of name checked ("Username" or "Repository")
+        
+    Returns:
+        Result for the check
+    """
+    return Result(
+        name=name,
+        status=TerminalUI.format_status(status_code, service_type),
+        cat=_STATUS_CATEGORIES.get(status_code, ERROR)
+    )
 
 
 class GitHubChecker:
     """Class for checking GitHub username and repository availability."""
     
     @staticmethod
-    def check_username(name: str) -> Dict[str, Any]:
+    def check_username(name: str) -> Result:
         """
         Check if a GitHub username is available.
         
@@ -21,21 +99,15 @@ class GitHubChecker:
             name: The GitHub username to check
             
         Returns:
-            Dict containing the name and status
+            Result containing the name and status
         """
-        url = f"{GITHUB_API_URL}/users/{name}"
-        status_code, _ = HTTPClient.make_request(url)
+        url = _USERS_PREFIX + name
+        status_code, _ = HTTPClient.make_request(url, method=_PROBE_METHOD)
         
-        return {
-            "name": name,
-            "status": format_status(status_code, "Username"),
-            "available": status_code == 404,
-            "taken": status_code == 200,
-            "error": status_code not in (200, 404)
-        }
+        return _build_result(name, status_code, "Username")
 
     @staticmethod
-    def check_repo(org_or_user: str, repo_name: str) -> Dict[str, Any]:
+    def check_repo(org_or_user: str, repo_name: str) -> Result:
         """
         Check if a GitHub repository name is available.
         
@@ -44,94 +116,150 @@ class GitHubChecker:
             repo_name: The repository name to check
             
         Returns:
-            Dict containing the name and status
+            Result containing the name and status
         """
-        url = f"{GITHUB_API_URL}/repos/{org_or_user}/{repo_name}"
-        status_code, _ = HTTPClient.make_request(url)
+        url = f"{_REPOS_PREFIX}{org_or_user}/{repo_name}"
+        status_code, _ = HTTPClient.make_request(url, method=_PROBE_METHOD)
         
-        return {
-            "name": f"{org_or_user}/{repo_name}",
-            "status": format_status(status_code, "Repository"),
-            "available": status_code == 404,
-            "taken": status_code == 200,
-            "error": status_code not in (200, 404)
-        }
+        return _build_result(f"{org_or_user}/{repo_name}", status_code, "Repository")
 
     @staticmethod
-    async def check_usernames_async(names: List[str]) -> List[Dict[str, Any]]:
+    async def check_username_async(
+        name: str,
+        request_manager: Optional[AsyncRequestManager] = None
+    ) -> Result:
+        """
+        Check if a GitHub username is available without blocking the event loop.
+        
+        Args:
+            name: The GitHub username to check
+            request_manager: Manager to send the request with (defaults to a short-lived one)
+            
+        Returns:
+            Result containing the name and status
+        """
+        status_code = await _probe_status(_USERS_PREFIX + name, request_manager)
+        
+        return _build_result(name, status_code, "Username")
+
+    @staticmethod
+    async def check_repo_async(
+        org_or_user: str, repo_name: str,
+        request_manager: Optional[AsyncRequestManager] = None
+    ) -> Result:
+        """
+        Check if a GitHub repository name is available without blocking the event loop.
+        
+        Args:
+            org_or_user: The GitHub organization or username
+            repo_name: The repository name to check
+            request_manager: Manager to send the request with (defaults to a short-lived one)
+            
+        Returns:
+            Result containing the name and status
+        """
+        status_code = await _probe_status(f"{_REPOS_PREFIX}{org_or_user}/{repo_name}", request_manager)
+        
+        return _build_result(f"{org_or_user}/{repo_name}", status_code, "Repository")
+
+    @staticmethod
+    async def check_usernames_async(
+        names: List[str],
+        on_progress: Optional[Callable[[int], None]] = None,
+        request_manager: Optional[AsyncRequestManager] = None
+    ) -> List[Result]:
         """
         Check multiple GitHub usernames concurrently.
         
         Args:
             names: List of GitHub usernames to check
+            on_progress: Optional callback receiving the number of newly finished checks
+            request_manager: Manager to send the requests with (defaults to a short-lived one)
             
         Returns:
-            List of dictionaries with check results
+            List of check results
         """
-        request_manager = AsyncRequestManager()
-        urls = [f"{GITHUB_API_URL}/users/{name}" for name in names]
+        urls = [_USERS_PREFIX + name for name in names]
         
-        results = await request_manager.batch_get(urls)
+        results = await _batch_probe(request_manager, urls, on_progress)
         
         # Process results
         processed_results = []
-        for i, (url, status_code, _) in enumerate(results):
-            name = names[i]
-            processed_results.append({
-                "name": name,
-                "status": format_status(status_code, "Username"),
-                "available": status_code == 404,
-                "taken": status_code == 200,
-                "error": status_code not in (200, 404)
-            })
+        for name, (_url, status_code, _body) in zip(names, results):
+            processed_results.append(_build_result(name, status_code, "Username"))
         
         return processed_results
 
     @staticmethod
-    async def check_repos_async(org_or_user: str, repo_names: List[str]) -> List[Dict[str, Any]]:
+    async def check_repos_async(
+        org_or_user: str,
+        repo_names: List[str],
+        on_progress: Optional[Callable[[int], None]] = None,
+        request_manager: Optional[AsyncRequestManager] = None
+    ) -> List[Result]:
         """
         Check multiple GitHub repository names concurrently.
         
         Args:
             org_or_user: The GitHub organization or username
             repo_names: List of repository names to check
+            on_progress: Optional callback receiving the number of newly finished checks
+            request_manager: Manager to send the requests with (defaults to a short-lived one)
             
         Returns:
-            List of dictionaries with check results
+            List of check results
         """
-        request_manager = AsyncRequestManager()
-        urls = [f"{GITHUB_API_URL}/repos/{org_or_user}/{name}" for name in repo_names]
+        prefix = f"{_REPOS_PREFIX}{org_or_user}/"
+        urls = [prefix + name for name in repo_names]
         
-        results = await request_manager.batch_get(urls)
+        results = await _batch_probe(request_manager, urls, on_progress)
         
         # Process results
         processed_results = []
-        for i, (url, status_code, _) in enumerate(results):
-            name = f"{org_or_user}/{repo_names[i]}"
-            processed_results.append({
-                "name": name,
-                "status": format_status(status_code, "Repository"),
-                "available": status_code == 404,
-                "taken": status_code == 200,
-                "error": status_code not in (200, 404)
-            })
+        full_names = [f"{org_or_user}/{name}" for name in repo_names]
+        for name, (_url, status_code, _body) in zip(full_names, results):
+            processed_results.append(_build_result(name, status_code, "Repository"))
         
         return processed_results
 
 
 # Exported compatibility functions
-def check_github_username(name: str) -> Dict[str, Any]:
+def check_github_username(name: str) -> Result:
     """Check GitHub username (wrapper for GitHubChecker.check_username)."""
     return GitHubChecker.check_username(name)
 
-def check_github_repo(org_or_user: str, repo_name: str) -> Dict[str, Any]:
+def check_github_repo(org_or_user: str, repo_name: str) -> Result:
     """Check GitHub repo (wrapper for GitHubChecker.check_repo)."""
     return GitHubChecker.check_repo(org_or_user, repo_name)
 
-async def check_github_usernames_async(names: List[str]) -> List[Dict[str, Any]]:
+async def check_github_username_async(
+    name: str,
+    request_manager: Optional[AsyncRequestManager] = None
+) -> Result:
+    """Async GitHub username check (wrapper for GitHubChecker.check_username_async)."""
+    return await GitHubChecker.check_username_async(name, request_manager)
+
+async def check_github_repo_async(
+    org_or_user: str,
+    repo_name: str,
+    request_manager: Optional[AsyncRequestManager] = None
+) -> Result:
+    """Async GitHub repo check (wrapper for GitHubChecker.check_repo_async)."""
+    return await GitHubChecker.check_repo_async(org_or_user, repo_name, request_manager)
+
+async def check_github_usernames_async(
+    names: List[str],
+    on_progress: Optional[Callable[[int], None]] = None,
+    request_manager: Optional[AsyncRequestManager] = None
+) -> List[Result]:
     """Check multiple GitHub usernames (wrapper for GitHubChecker.check_usernames_async)."""
-    return await GitHubChecker.check_usernames_async(names)
+    return await GitHubChecker.check_usernames_async(names, on_progress, request_manager)
 
-async def check_github_repos_async(org_or_user: str, repo_names: List[str]) -> List[Dict[str, Any]]:
+async def check_github_repos_async(
+    org_or_user: str,
+    repo_names: List[str],
+    on_progress: Optional[Callable[[int], None]] = None,
+    request_manager: Optional[AsyncRequestManager] = None
+) -> List[Result]:
     """Check multiple GitHub repos (wrapper for GitHubChecker.check_repos_async)."""
-    return await GitHubChecker.check_repos_async(org_or_user, repo_names) 
\ No newline at end of file
+    return await GitHubChecker.check_repos_async(org_or_user, repo_names, on_progress, request_manager) 
\ No newline at end of file
@@ -1,38 +1,27 @@
 """
 Main CLI entry point for the Checkson application.
 """
-import asyncio
 import typer
 import sys
 import os
-from typing import List, Optional
+import mmap
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from pathlib import Path
+from types import ModuleType
 import time
+from collections import Counter
 
-from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-
-from ..utils.terminal import (
-    print_header, 
-    print_subheader, 
-    print_result_table, 
-    print_summary,
-    create_progress_bar,
-    console,
-    clear_terminal,
-    TerminalUI
-)
-from ..checkers.github import (
-    check_github_username,
-    check_github_usernames_async,
-    check_github_repo,
-    check_github_repos_async
-)
-from ..checkers.domains import check_domain, check_domains_async
+from ..utils.terminal import console, TerminalUI
+from ..utils.config import MAX_CONCURRENT_REQUESTS
+from ..checkers._result import AVAILABLE, ERROR, TAKEN, Result
+from ..utils.validators import is_valid_domain, is_valid_github_repo, is_valid_github_username
 from ..__init__ import __version__
 
+# Checkers, HTTP clients, prompts and asyncio are imported inside the code that uses
+# them, so --version, --help and single-kind runs skip the unneeded imports
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+
 # Create Typer app with rich formatting
 app = typer.Typer(
     help="✨ Checkson - A fast and user-friendly availability checker ✨",
@@ -42,77 +31,503 @@ app = typer.Typer(
 )
 
 
-# Helper function to launch interactive menu when no command is provided
-def launch_interactive_mode():
-    """Launch the interactive menu mode."""
-    # We import locally to avoid circular imports
+def _get_asyncio() -> ModuleType:
+    """
+    Import asyncio on first use, switching to uvloop when it is available.
+    
+    Returns:
+        The asyncio module, with the event loop policy set up
+    """
+    import asyncio
+    
+    # Use the faster libuv-based event loop when it is available
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+    return asyncio
+
+
+async def _gather_with_progress(
+    checks: List[Awaitable["Result"]],
+    progress: "Progress",
+    task: "TaskID",
+    concurrency: int = MAX_CONCURRENT_REQUESTS
+) -> List["Result"]:
+    """
+    Run checks concurrently, advancing the progress bar as each one finishes.
+    
+    Args:
+        checks: Awaitables producing one result each
+        progress: The progress bar to update
+        task: The progress task to advance
+        concurrency: Maximum number of checks in flight at once
+        
+    Returns:
+        List of results in the same order as checks
+    """
+    import asyncio
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def limited(check: Awaitable["Result"]) -> "Result":
+        async with semaphore:
+            return await check
+    
+    tasks = [asyncio.create_task(limited(check)) for check in checks]
     try:
-        # We create a minimal implementation that can launch the interactive menu
-        clear_terminal()
-        print_header(f"✨ Checkson v{__version__} ✨", clear=False)
+        for finished in asyncio.as_completed(tasks):
+            await finished
+            progress.update(task, advance=1)
+    finally:
+        # Cancel whatever is still pending if we were interrupted
+        for pending in tasks:
+            pending.cancel()
+    return [t.result() for t in tasks]
+
+
+# Input files at least this large are read through mmap
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def _collect(input_file: Optional[Path], positional: Optional[List[str]]) -> Iterator[str]:
+    """
+    Yield names from an input file (one per line) followed by positional arguments.
+    
+    Args:
+        input_file: Optional file containing one name per line
+        positional: Names given on the command line
+        
+    Yields:
+        Each non-empty name, in input order
+    """
+    if input_file:
+        if os.path.getsize(input_file) < _MMAP_THRESHOLD:
+            # Small files are cheapest to read in one go and split
+            lines = (line.strip() for line in input_file.read_text(encoding="utf-8").splitlines())
+            yield from filter(None, lines)
+        else:
+            # Scan large files as bytes and only decode the non-empty lines
+            with open(input_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                lines = (line.strip() for line in iter(mm.readline, b''))
+                yield from (line.decode('utf-8') for line in lines if line)
+    yield from positional or ()
+
+
+def _collect_inputs(
+    args: Optional[List[str]],
+    input_file: Optional[Path],
+    interactive: bool,
+    prompt: str,
+    noun: str
+) -> List[str]:
+    """
+    Gather the names to check from a file, the arguments and interactive prompts.
+    
+    Args:
+        args: Names given on the command line
+        input_file: Optional file containing one name per line
+        interactive: Whether to prompt for more names even if some were given
+        prompt: Label shown when prompting for a name
+        noun: Plural description of the names, used in messages
         
-        console.print(Panel(
-            Text("A fast, user-friendly availability checker for GitHub usernames,\nrepositories, and domain names.", 
-                 style="cyan", justify="center"),
-            border_style="blue",
-            box=box.ROUNDED
-        ))
+    Returns:
+        List of stripped, non-empty names in input order (duplicates are kept,
+        so the results table has one row per input)
+    """
+    try:
+        names = list(_collect(input_file, args))
+    except Exception as e:
+        console.print(f"[bold red]Error reading file:[/bold red] {str(e)}")
+        raise typer.Exit(1)
+    
+    # Interactive mode if no names provided or explicitly requested
+    if not names or interactive:
+        from rich.prompt import Prompt
         
-        options = [
-            {
-                "name": "🔍 GitHub Usernames", 
-                "description": "Check availability of GitHub usernames",
-                "value": "github"
-            },
-            {
-                "name": "📁 GitHub Repositories", 
-                "description": "Check if repositories exist under an owner",
-                "value": "repo"
-            },
-            {
-                "name": "🌐 Domain Names", 
-                "description": "Check if domain names are available",
-                "value": "domain"
-            },
-            {
-                "name": "❓ Help", 
-                "description": "Show help information",
-                "value": "help"
-            },
-            {
-                "name": "❌ Exit", 
-                "description": "Exit the application",
-                "value": "exit"
-            }
-        ]
+        TerminalUI.print_subheader(f"Enter {noun} to check (empty line to finish):")
+        while True:
+            name = Prompt.ask(f"[bold cyan]{prompt}[/bold cyan]").strip()
+            if not name:
+                break
+            names.append(name)
+    
+    if not names:
+        console.print(f"[bold yellow]No {noun} to check.[/bold yellow]")
+        raise typer.Exit(0)
+    
+    return names
+
+
+def _canonical_github_name(name: str) -> str:
+    """Normalize a GitHub username or repository name (case-insensitive on GitHub)."""
+    return name.strip().lower()
+
+
+def _canonical_domain(domain: str) -> str:
+    """Normalize a domain name to its lowercase ASCII (IDNA) form."""
+    domain = domain.strip().rstrip(".").lower()
+    try:
+        return domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        # Leave names IDNA can't encode as-is; the check will report them
+        return domain
+
+
+def _fan_out(results: List["Result"], keys: List[str], labels: List[str]) -> List["Result"]:
+    """
+    Map results for de-duplicated inputs back onto every original input.
+    
+    Args:
+        results: Results for the unique keys, in first-seen order
+        keys: Canonical key of each original input
+        labels: Display name for each original input
+    
+    Returns:
+        One result per original input, named after that input
+    """
+    result_by_key = dict(zip(dict.fromkeys(keys), results))
+    return [result_by_key[key]._replace(name=label) for key, label in zip(keys, labels)]
+
+
+def _tally(results: List["Result"]) -> Tuple[int, int, int]:
+    """
+    Count available, taken and errored results in a single pass.
+    
+    Args:
+        results: The results to count
+    
+    Returns:
+        Tuple of (available, taken, errors)
+    """
+    counts = Counter(r.cat for r in results)
+    return counts[AVAILABLE], counts[TAKEN], counts[ERROR]
+
+
+def _invalid_result(name: str) -> "Result":
+    """Build the result for a name that failed local validation."""
+    return Result(name=name, status="⚠️ Invalid", cat=ERROR)
+
+
+def _merge_invalid(keys: List[str], checked: List[str], results: List["Result"]) -> List["Result"]:
+    """
+    Merge results for the checked names with results for the rejected ones.
+    
+    Args:
+        keys: Every distinct name, in first-seen order
+        checked: The names that passed validation and were checked
+        results: Results for the checked names, in the same order
+    
+    Returns:
+        List of results in the same order as keys
+    """
+    by_key = dict(zip(checked, results))
+    return [by_key[key] if key in by_key else _invalid_result(key) for key in keys]
+
+
+def _load_github_checkers() -> "Tuple[Callable[..., Result], Callable[..., Awaitable[Result]]]":
+    """Import the GitHub username checkers."""
+    from ..checkers.github import check_github_username, check_github_username_async
+    return check_github_username, check_github_username_async
+
+
+def _load_repo_checkers() -> "Tuple[Callable[..., Result], Callable[..., Awaitable[Result]]]":
+    """Import the GitHub repository checkers."""
+    from ..checkers.github import check_github_repo, check_github_repo_async
+    return check_github_repo, check_github_repo_async
+
+
+def _load_domain_checkers() -> "Tuple[Callable[..., Result], Callable[..., Awaitable[List[Result]]]]":
+    """Import the domain checkers (the async one resolves the whole list in one batch)."""
+    from ..checkers.domains import check_domain, check_domains_async
+    return check_domain, check_domains_async
+
+
+def _is_valid_repo(owner: str, name: str) -> bool:
+    """Check that both the owner and the repository name are well-formed."""
+    return is_valid_github_username(owner) and is_valid_github_repo(name)
+
+
+class _CheckKind(NamedTuple):
+    """How to check one kind of name."""
+    subject: str  # what is being checked, formatted with the extra arguments
+    task: str  # progress bar description
+    title: str  # results table title
+    canonical: Callable[[str], str]  # normalizes a name for de-duplication
+    is_valid: Callable[..., bool]  # called with the extra arguments and a name
+    load: Callable[[], "Tuple[Callable[..., Result], Callable[..., Awaitable[Any]]]"]
+    uses_http: bool  # whether the async checker takes a shared AsyncRequestManager
+    batched: bool = False  # whether the async checker takes the whole list and reports progress
+
+
+# Checkers for each command, imported only when that command runs
+CHECKERS: Dict[str, _CheckKind] = {
+    "github": _CheckKind(
+        subject="GitHub usernames",
+        task="Checking usernames...",
+        title="GitHub Username Results",
+        canonical=_canonical_github_name,
+        is_valid=is_valid_github_username,
+        load=_load_github_checkers,
+        uses_http=True
+    ),
+    "repo": _CheckKind(
+        subject="repositories under {0}",
+        task="Checking repositories...",
+        title="GitHub Repository Results",
+        canonical=_canonical_github_name,
+        is_valid=_is_valid_repo,
+        load=_load_repo_checkers,
+        uses_http=True
+    ),
+    "domain": _CheckKind(
+        subject="domains",
+        task="Checking domains...",
+        title="Domain Results",
+        canonical=_canonical_domain,
+        is_valid=is_valid_domain,
+        load=_load_domain_checkers,
+        uses_http=False,
+        batched=True
+    ),
+}
+
+
+async def _run_async(
+    kind: _CheckKind,
+    check_async: "Callable[..., Awaitable[Any]]",
+    names: List[str],
+    extra: Tuple[str, ...],
+    progress: "Progress",
+    task: "TaskID",
+    concurrency: int
+) -> List["Result"]:
+    """
+    Check names concurrently, sharing one HTTP client when the checker needs it.
+    
+    Args:
+        kind: The kind of check being run
+        check_async: The async checker for a single name (or the whole list, if batched)
+        names: Names to check
+        extra: Arguments passed to the checker before each name
+        progress: The progress bar to update
+        task: The progress task to advance
+        concurrency: Maximum number of checks in flight at once
+    
+    Returns:
+        List of results in the same order as names
+    """
+    if kind.batched:
+        def advance(count: int) -> None:
+            progress.update(task, advance=count)
         
-        # Show the menu and get choice
-        choice = TerminalUI.smart_menu("Please select an option:", options)
+        results: List["Result"] = await check_async(*extra, names, concurrency, advance)
+        return results
+    
+    if not kind.uses_http:
+        checks = [check_async(*extra, name) for name in names]
+        return await _gather_with_progress(checks, progress, task, concurrency)
+    
+    from ..utils.http import AsyncRequestManager
+    
+    async with AsyncRequestManager(max_concurrent=concurrency) as request_manager:
+        checks = [check_async(*extra, name, request_manager) for name in names]
+        return await _gather_with_progress(checks, progress, task, concurrency)
+
+
+def _run_check(
+    kind_name: str,
+    inputs: List[str],
+    async_mode: bool,
+    concurrency: int,
+    extra: Tuple[str, ...] = (),
+    labels: Optional[List[str]] = None
+) -> None:
+    """
+    Check a list of names and print the results table and summary.
+    
+    Args:
+        kind_name: Key into CHECKERS
+        inputs: Names to check, as entered
+        async_mode: Whether to check multiple names concurrently (otherwise one at a time)
+        concurrency: Maximum number of checks in flight at once in async mode
+        extra: Arguments passed to the checkers before each name
+        labels: Display name for each input (defaults to the inputs)
+    """
+    kind = CHECKERS[kind_name]
+    check, check_async = kind.load()
+    
+    # Check each distinct valid name once, then map results back to every input
+    keys = [kind.canonical(item) for item in inputs]
+    unique_keys = list(dict.fromkeys(keys))
+    names_to_check = [name for name in unique_keys if kind.is_valid(*extra, name)]
+    
+    # Display what we're checking
+    TerminalUI.print_subheader(f"Checking {len(names_to_check)} {kind.subject.format(*extra)}...")
+    
+    # Start the check
+    start_time = time.perf_counter()
+    results: List["Result"] = []
+    
+    if not names_to_check:
+        # Nothing passed validation, so there is nothing to send
+        pass
+    elif len(names_to_check) == 1:
+        # A single check needs neither the event loop nor a progress bar
+        results = [check(*extra, names_to_check[0])]
+    else:
+        # Sync mode is the same async path, one check at a time
+        if not async_mode:
+            concurrency = 1
         
-        # Handle the selected option
-        if choice == "exit":
-            console.print("[yellow]Goodbye! Thanks for using Checkson.[/yellow]")
-            return
-        elif choice == "help":
-            # Show help and return to menu
-            clear_terminal()
-            os.system(f"{sys.executable} -m checkson --help")
-            console.print("\n[bold cyan]Press Enter to return to the main menu...[/bold cyan]")
-            input()
-            return launch_interactive_mode()
-        else:
-            # Run the selected command
-            clear_terminal()
-            cmd = f"{sys.executable} -m checkson {choice} --interactive"
-            console.print(f"[dim]Running: {cmd}[/dim]\n")
+        asyncio = _get_asyncio()
+        with TerminalUI.create_progress_bar() as progress:
+            task = progress.add_task(kind.task, total=len(names_to_check))
+            results = asyncio.run(
+                _run_async(kind, check_async, names_to_check, extra, progress, task, concurrency)
+            )
+    
+    results = _merge_invalid(unique_keys, names_to_check, results)
+    results = _fan_out(results, keys, labels or inputs)
+    
+    # Calculate stats in a single pass
+    available, taken, errors = _tally(results)
+    
+    # Print results
+    elapsed = time.perf_counter() - start_time
+    TerminalUI.print_result_table(results, f"{kind.title} (completed in {elapsed:.2f}s)")
+    TerminalUI.print_summary(len(results), available, taken, errors)
+
+
+def _invoke(args: List[str]) -> int:
+    """
+    Run a CLI command in the current process, as if it were given on the command line.
+    
+    Args:
+        args: Command-line arguments, e.g. ["github", "--interactive"]
+        
+    Returns:
+        The command's exit code
+    """
+    command = typer.main.get_command(app)
+    try:
+        command.main(args, prog_name="checkson")
+    except SystemExit as e:
+        # Commands finish by exiting; stay in the menu and keep the code instead
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        return 1
+    return 0
+
+
+def _show_help() -> None:
+    """Render the top-level help text in the current process."""
+    command = typer.main.get_command(app)
+    with typer.Context(command, info_name="checkson") as ctx:
+        help_text = command.get_help(ctx)
+    
+    # With rich markup enabled Typer prints the help itself and returns ""
+    if help_text:
+        console.print(help_text)
+
+
+def run_menu_choice(choice: str) -> bool:
+    """
+    Run a single interactive menu choice: show the help or a check command.
+    
+    Args:
+        choice: The selected menu value ("help" or a command name)
+        
+    Returns:
+        True if the user wants to go back to the main menu, False to exit
+    """
+    TerminalUI.clear_terminal()
+    if choice == "help":
+        _show_help()
+        console.print("\n[bold cyan]Press Enter to return to the main menu...[/bold cyan]")
+        input()
+        return True
+    
+    # Run the selected command in this process
+    args = [choice, "--interactive"]
+    if choice == "repo":
+        from rich.prompt import Prompt
+        
+        owner = Prompt.ask("[bold cyan]GitHub username or organization[/bold cyan]").strip()
+        if owner:
+            args += ["--owner", owner]
+    
+    exit_code = _invoke(args)
+    if exit_code:
+        console.print(f"\n[yellow]The command exited with status {exit_code}.[/yellow]")
+    
+    # Ask if user wants to return to main menu
+    console.print("\n[bold cyan]Return to main menu? (y/n)[/bold cyan] ", end="")
+    response = input().lower()
+    return response == "" or response.startswith("y")
+
+
+# Helper function to launch interactive menu when no command is provided
+def launch_interactive_mode():
+    """Launch the interactive menu mode."""
+    # We import locally to avoid circular imports
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    
+    # The menu options never change, so build them once
+    options = [
+        {
+            "name": "🔍 GitHub Usernames", 
+            "description": "Check availability of GitHub usernames",
+            "value": "github"
+        },
+        {
+            "name": "📁 GitHub Repositories", 
+            "description": "Check if repositories exist under an owner",
+            "value": "repo"
+        },
+        {
+            "name": "🌐 Domain Names", 
+            "description": "Check if domain names are available",
+            "value": "domain"
+        },
+        {
+            "name": "❓ Help", 
+            "description": "Show help information",
+            "value": "help"
+        },
+        {
+            "name": "❌ Exit", 
+            "description": "Exit the application",
+            "value": "exit"
+        }
+    ]
+    
+    try:
+        # Loop back to the menu instead of recursing, so the stack stays flat
+        while True:
+            TerminalUI.clear_terminal()
+            TerminalUI.print_header(f"✨ Checkson v{__version__} ✨", clear=False)
+            
+            console.print(Panel(
+                Text("A fast, user-friendly availability checker for GitHub usernames,\nrepositories, and domain names.", 
+                     style="cyan", justify="center"),
+                border_style="blue",
+                box=box.ROUNDED
+            ))
             
-            result = os.system(cmd)
+            # Show the menu and get choice
+            choice = TerminalUI.smart_menu("Please select an option:", options)
             
-            # Ask if user wants to return to main menu
-            console.print("\n[bold cyan]Return to main menu? (y/n)[/bold cyan] ", end="")
-            response = input().lower()
-            if response == "" or response.startswith("y"):
-                return launch_interactive_mode()
+            # Handle the selected option
+            if choice == "exit":
+                console.print("[yellow]Goodbye! Thanks for using Checkson.[/yellow]")
+                return
+            elif not run_menu_choice(choice):
+                return
     
     except KeyboardInterrupt:
         console.print("\n[yellow]Operation cancelled. Goodbye![/yellow]")
@@ -122,6 +537,33 @@ def launch_interactive_mode():
         time.sleep(2)
 
 
+# Options shared by all check commands, built once at import
+_INPUT_FILE_OPT = typer.Option(
+    None, 
+    "--file", 
+    "-f", 
+    help="File containing names to check (one per line)"
+)
+_ASYNC_OPT = typer.Option(
+    True, 
+    "--async/--sync", 
+    help="Use async mode for faster checking"
+)
+_CONCURRENCY_OPT = typer.Option(
+    MAX_CONCURRENT_REQUESTS,
+    "--concurrency",
+    "-c",
+    min=1,
+    help="Maximum number of checks in flight at once in async mode"
+)
+_INTERACTIVE_OPT = typer.Option(
+    False, 
+    "--interactive", 
+    "-i", 
+    help="Interactive mode"
+)
+
+
 @app.callback(invoke_without_command=True)
 def callback(
     version: Optional[bool] = typer.Option(
@@ -136,7 +578,7 @@ def callback(
     """
     # Show version and exit if requested
     if version:
-        print_header(f"✨ Checkson v{__version__} ✨")
+        TerminalUI.print_header(f"✨ Checkson v{__version__} ✨")
         console.print(f"[bold]Checkson[/bold] version: [cyan]{__version__}[/cyan]")
         raise typer.Exit()
     
@@ -152,23 +594,10 @@ def github(
         None, 
         help="GitHub usernames to check"
     ),
-    input_file: Optional[Path] = typer.Option(
-        None, 
-        "--file", 
-        "-f", 
-        help="File containing usernames to check (one per line)"
-    ),
-    async_mode: bool = typer.Option(
-        True, 
-        "--async/--sync", 
-        help="Use async mode for faster checking"
-    ),
-    interactive: bool = typer.Option(
-        False, 
-        "--interactive", 
-        "-i", 
-        help="Interactive mode"
-    )
+    input_file: Optional[Path] = _INPUT_FILE_OPT,
+    async_mode: bool = _ASYNC_OPT,
+    concurrency: int = _CONCURRENCY_OPT,
+    interactive: bool = _INTERACTIVE_OPT
 ):
     """
     🔍 Check GitHub username availability.
@@ -176,74 +605,11 @@ def github(
     Quickly find out if GitHub usernames are available for registration.
     """
     # Show the header
-    print_header(f"✨ Checkson v{__version__} ✨")
-    
-    names_to_check = []
-    
-    # Load from file if specified
-    if input_file:
-        try:
-            with open(input_file, 'r') as f:
-                file_names = [line.strip() for line in f if line.strip()]
-                names_to_check.extend(file_names)
-        except Exception as e:
-            console.print(f"[bold red]Error reading file:[/bold red] {str(e)}")
-            raise typer.Exit(1)
-    
-    # Add names from arguments
-    if usernames:
-        names_to_check.extend(usernames)
-    
-    # Interactive mode if no names provided or explicitly requested
-    if not names_to_check or interactive:
-        print_subheader("Enter GitHub usernames to check (empty line to finish):")
-        while True:
-            name = Prompt.ask("[bold cyan]Username[/bold cyan]")
-            if not name:
-                break
-            names_to_check.append(name)
-    
-    if not names_to_check:
-        console.print("[bold yellow]No usernames to check.[/bold yellow]")
-        raise typer.Exit(0)
-    
-    # Display what we're checking
-    print_subheader(f"Checking {len(names_to_check)} GitHub usernames...")
-    
-    # Start the check
-    start_time = time.time()
-    results = []
-    
-    if async_mode and len(names_to_check) > 1:
-        # Use async for multiple names
-        with create_progress_bar() as progress:
-            task = progress.add_task("Checking usernames...", total=len(names_to_check))
-            
-            async def run_async_check():
-                nonlocal results
-                results = await check_github_usernames_async(names_to_check)
-                progress.update(task, completed=len(names_to_check))
-            
-            asyncio.run(run_async_check())
-    else:
-        # Use sync for a single name or if async mode is disabled
-        with create_progress_bar() as progress:
-            task = progress.add_task("Checking usernames...", total=len(names_to_check))
-            
-            for name in names_to_check:
-                result = check_github_username(name)
-                results.append(result)
-                progress.update(task, advance=1)
-    
-    # Calculate stats
-    available = sum(1 for r in results if r.get('available', False))
-    taken = sum(1 for r in results if r.get('taken', False))
-    errors = sum(1 for r in results if r.get('error', False))
+    TerminalUI.print_header(f"✨ Checkson v{__version__} ✨")
     
-    # Print results
-    elapsed = time.time() - start_time
-    print_result_table(results, f"GitHub Username Results (completed in {elapsed:.2f}s)")
-    print_summary(len(results), available, taken, errors)
+    # Load names from the file, the arguments and interactive prompts
+    names_to_check = _collect_inputs(usernames, input_file, interactive, "Username", "GitHub usernames")
+    _run_check("github", names_to_check, async_mode, concurrency)
 
 
 @app.command()
@@ -258,23 +624,10 @@ def repo(
         None, 
         help="Repository names to check"
     ),
-    input_file: Optional[Path] = typer.Option(
-        None, 
-        "--file", 
-        "-f", 
-        help="File containing repository names to check (one per line)"
-    ),
-    async_mode: bool = typer.Option(
-        True, 
-        "--async/--sync", 
-        help="Use async mode for faster checking"
-    ),
-    interactive: bool = typer.Option(
-        False, 
-        "--interactive", 
-        "-i", 
-        help="Interactive mode"
-    )
+    input_file: Optional[Path] = _INPUT_FILE_OPT,
+    async_mode: bool = _ASYNC_OPT,
+    concurrency: int = _CONCURRENCY_OPT,
+    interactive: bool = _INTERACTIVE_OPT
 ):
     """
     📁 Check GitHub repository availability.
@@ -282,74 +635,18 @@ def repo(
     Check if repository names are available under a specific user or organization.
     """
     # Show the header
-    print_header(f"✨ Checkson v{__version__} ✨")
-    
-    names_to_check = []
-    
-    # Load from file if specified
-    if input_file:
-        try:
-            with open(input_file, 'r') as f:
-                file_names = [line.strip() for line in f if line.strip()]
-                names_to_check.extend(file_names)
-        except Exception as e:
-            console.print(f"[bold red]Error reading file:[/bold red] {str(e)}")
-            raise typer.Exit(1)
-    
-    # Add names from arguments
-    if names:
-        names_to_check.extend(names)
-    
-    # Interactive mode if no names provided or explicitly requested
-    if not names_to_check or interactive:
-        print_subheader("Enter repository names to check (empty line to finish):")
-        while True:
-            name = Prompt.ask("[bold cyan]Repository name[/bold cyan]")
-            if not name:
-                break
-            names_to_check.append(name)
-    
-    if not names_to_check:
-        console.print("[bold yellow]No repository names to check.[/bold yellow]")
-        raise typer.Exit(0)
-    
-    # Display what we're checking
-    print_subheader(f"Checking {len(names_to_check)} repositories under {owner}...")
-    
-    # Start the check
-    start_time = time.time()
-    results = []
-    
-    if async_mode and len(names_to_check) > 1:
-        # Use async for multiple names
-        with create_progress_bar() as progress:
-            task = progress.add_task("Checking repositories...", total=len(names_to_check))
-            
-            async def run_async_check():
-                nonlocal results
-                results = await check_github_repos_async(owner, names_to_check)
-                progress.update(task, completed=len(names_to_check))
-            
-            asyncio.run(run_async_check())
-    else:
-        # Use sync for a single name or if async mode is disabled
-        with create_progress_bar() as progress:
-            task = progress.add_task("Checking repositories...", total=len(names_to_check))
-            
-            for name in names_to_check:
-                result = check_github_repo(owner, name)
-                results.append(result)
-                progress.update(task, advance=1)
-    
-    # Calculate stats
-    available = sum(1 for r in results if r.get('available', False))
-    taken = sum(1 for r in results if r.get('taken', False))
-    errors = sum(1 for r in results if r.get('error', False))
-    
-    # Print results
-    elapsed = time.time() - start_time
-    print_result_table(results, f"GitHub Repository Results (completed in {elapsed:.2f}s)")
-    print_summary(len(results), available, taken, errors)
+    TerminalUI.print_header(f"✨ Checkson v{__version__} ✨")
+    
+    # Load names from the file, the arguments and interactive prompts
+    names_to_check = _collect_inputs(names, input_file, interactive, "Repository name", "repository names")
+    _run_check(
+        "repo",
+        names_to_check,
+        async_mode,
+        concurrency,
+        extra=(owner,),
+        labels=[f"{owner}/{name}" for name in names_to_check]
+    )
 
 
 @app.command()
@@ -358,23 +655,10 @@ def domain(
         None, 
         help="Domain names to check"
     ),
-    input_file: Optional[Path] = typer.Option(
-        None, 
-        "--file", 
-        "-f", 
-        help="File containing domain names to check (one per line)"
-    ),
-    async_mode: bool = typer.Option(
-        True, 
-        "--async/--sync", 
-        help="Use async mode for faster checking"
-    ),
-    interactive: bool = typer.Option(
-        False, 
-        "--interactive", 
-        "-i", 
-        help="Interactive mode"
-    )
+    input_file: Optional[Path] = _INPUT_FILE_OPT,
+    async_mode: bool = _ASYNC_OPT,
+    concurrency: int = _CONCURRENCY_OPT,
+    interactive: bool = _INTERACTIVE_OPT
 ):
     """
     🌐 Check domain name availability.
@@ -382,75 +666,8 @@ def domain(
     Find out if domain names are registered or available for purchase.
     """
     # Show the header
-    print_header(f"✨ Checkson v{__version__} ✨")
-    
-    domains_to_check = []
-    
-    # Load from file if specified
-    if input_file:
-        try:
-            with open(input_file, 'r') as f:
-                file_domains = [line.strip() for line in f if line.strip()]
-                domains_to_check.extend(file_domains)
-        except Exception as e:
-            console.print(f"[bold red]Error reading file:[/bold red] {str(e)}")
-            raise typer.Exit(1)
-    
-    # Add domains from arguments
-    if domains:
-        domains_to_check.extend(domains)
-    
-    # Interactive mode if no domains provided or explicitly requested
-    if not domains_to_check or interactive:
-        print_subheader("Enter domain names to check (empty line to finish):")
-        while True:
-            domain = Prompt.ask("[bold cyan]Domain name[/bold cyan]")
-            if not domain:
-                break
-            domains_to_check.append(domain)
-    
-    if not domains_to_check:
-        console.print("[bold yellow]No domains to check.[/bold yellow]")
-        raise typer.Exit(0)
-    
-    # Display what we're checking
-    print_subheader(f"Checking {len(domains_to_check)} domains...")
-    
-    # Start the check
-    start_time = time.time()
-    results = []
-    
-    if async_mode and len(domains_to_check) > 1:
-        # Use async for multiple domains
-        with create_progress_bar() as progress:
-            task = progress.add_task("Checking domains...", total=len(domains_to_check))
-            
-            async def run_async_check():
-                nonlocal results
-                results = await check_domains_async(domains_to_check)
-                progress.update(task, completed=len(domains_to_check))
-            
-            asyncio.run(run_async_check())
-    else:
-        # Use sync for a single domain or if async mode is disabled
-        with create_progress_bar() as progress:
-            task = progress.add_task("Checking domains...", total=len(domains_to_check))
-            
-            for domain_name in domains_to_check:
-                result = check_domain(domain_name)
-                results.append(result)
-                progress.update(task, advance=1)
-    
-    # Calculate stats
-    available = sum(1 for r in results if r.get('available', False))
-    taken = sum(1 for r in results if r.get('taken', False))
-    errors = sum(1 for r in results if r.get('error', False))
+    TerminalUI.print_header(f"✨ Checkson v{__version__} ✨")
     
-    # Print results
-    elapsed = time.time() - start_time
-    print_result_table(results, f"Domain Results (completed in {elapsed:.2f}s)")
-    print_summary(len(results), available, taken, errors)
-
-
-if __name__ == "__main__":
-    app() 
\ No newline at end of file
+    # Load domains from the file, the arguments and interactive prompts
+    domains_to_check = _collect_inputs(domains, input_file, interactive, "Domain name", "domains")
+    _run_check("domain", domains_to_check, async_mode, concurrency)
\ No newline at end of file
@@ -1,51 +1,91 @@
 """
 Configuration module for Checkson application.
 """
+import math
 import os
-from typing import Dict, Optional
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
 # Load environment variables from .env file if present
 load_dotenv()
 
 
+def _env_float(name: str, default: float) -> float:
+    """Read a numeric setting from the environment, falling back to the default on bad input."""
+    try:
+        value = float(os.getenv(name, default))
+    except ValueError:
+        return default
+    return value if math.isfinite(value) else default
+
+
 @dataclass
 class APIConfig:
     """API configuration settings."""
     # GitHub API configuration
     GITHUB_API_URL: str = "https://api.github.com"
-    GITHUB_TOKEN: Optional[str] = os.getenv("GITHUB_TOKEN")
+    GITHUB_TOKEN: Optional[str] = field(default_factory=lambda: os.getenv("GITHUB_TOKEN"))
     
-    # Default headers for API requests
-    DEFAULT_HEADERS: Dict[str, str] = None
+    # Default headers for API requests (read-only, shared by every request)
+    DEFAULT_HEADERS: Mapping[str, str] = field(default_factory=dict)
     
     def __post_init__(self):
         """Initialize calculated fields after initialization."""
         # Initialize headers with token if available
-        self.DEFAULT_HEADERS = {
+        headers = {
             "Accept": "application/vnd.github+json",
             "User-Agent": "Checkson-Availability-Checker/1.0.0",
         }
         
         if self.GITHUB_TOKEN:
-            self.DEFAULT_HEADERS["Authorization"] = f"Bearer {self.GITHUB_TOKEN}"
+            headers["Authorization"] = f"Bearer {self.GITHUB_TOKEN}"
+        
+        self.DEFAULT_HEADERS = MappingProxyType(headers)
 
 
 @dataclass
 class RateLimitConfig:
     """Rate limiting configuration settings."""
     # Rate limiting configuration
-    REQUEST_DELAY: float = 0.1  # seconds between requests in sequential mode
+    REQUEST_DELAY: float = field(default_factory=lambda: _env_float("CHECKSON_REQUEST_DELAY", 0.0))  # optional pause after each request (seconds)
     MAX_CONCURRENT_REQUESTS: int = 10  # maximum number of concurrent requests in async mode
+    REQUESTS_PER_SECOND: float = field(default_factory=lambda: _env_float("CHECKSON_REQUESTS_PER_SECOND", 0.0))  # async request rate per host (0 = unlimited)
+    MAX_RATE_LIMIT_WAIT: float = 60  # longest pause (seconds) for an exhausted API quota to reset
     REQUEST_TIMEOUT: int = 5  # default timeout for all requests (seconds)
 
 
+@dataclass
+class CacheConfig:
+    """In-process cache configuration settings."""
+    # DNS result caching (seconds); positive TTL is clamped to DNS_CACHE_MAX_TTL
+    DNS_CACHE_TTL: float = field(default_factory=lambda: _env_float("CHECKSON_DNS_CACHE_TTL", 300.0))
+    DNS_NEGATIVE_CACHE_TTL: float = field(default_factory=lambda: _env_float("CHECKSON_DNS_NEGATIVE_CACHE_TTL", 60.0))
+    DNS_CACHE_MAX_TTL: float = 3600
+    DNS_CACHE_SIZE: int = 4096  # maximum number of cached domains
+    
+    # GitHub API response caching (seconds); kept short since names can be freed or claimed
+    RESPONSE_CACHE_TTL: float = field(default_factory=lambda: _env_float("CHECKSON_RESPONSE_CACHE_TTL", 60.0))
+    
+    # ETags persisted between runs so repeat checks can be answered with 304s; "" disables it
+    ETAG_CACHE_FILE: str = os.getenv(
+        "CHECKSON_ETAG_CACHE",
+        os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "checkson", "etag.json")
+    )
+    ETAG_CACHE_SIZE: int = 4096  # maximum number of persisted ETags
+    
+    def __post_init__(self):
+        """Clamp TTLs to sane bounds."""
+        self.DNS_CACHE_TTL = max(0.0, min(self.DNS_CACHE_TTL, self.DNS_CACHE_MAX_TTL))
+        self.DNS_NEGATIVE_CACHE_TTL = max(0.0, min(self.DNS_NEGATIVE_CACHE_TTL, self.DNS_CACHE_TTL))
+
+
 @dataclass
 class UIConfig:
     """Terminal UI configuration settings."""
     # Terminal styling configuration
-    STYLE_CONFIG: Dict[str, str] = None
+    STYLE_CONFIG: Dict[str, str] = field(default_factory=dict)
     
     # Result indicators
     AVAILABLE_INDICATOR: str = "✅"
@@ -69,6 +109,7 @@ class UIConfig:
 # Create global configuration instances
 api_config = APIConfig()
 rate_limit_config = RateLimitConfig()
+cache_config = CacheConfig()
 ui_config = UIConfig()
 
 # Exported variables for backward compatibility
@@ -78,8 +119,17 @@ DEFAULT_HEADERS = api_config.DEFAULT_HEADERS
 
 REQUEST_DELAY = rate_limit_config.REQUEST_DELAY
 MAX_CONCURRENT_REQUESTS = rate_limit_config.MAX_CONCURRENT_REQUESTS
+REQUESTS_PER_SECOND = rate_limit_config.REQUESTS_PER_SECOND
+MAX_RATE_LIMIT_WAIT = rate_limit_config.MAX_RATE_LIMIT_WAIT
 REQUEST_TIMEOUT = rate_limit_config.REQUEST_TIMEOUT
 
+DNS_CACHE_TTL = cache_config.DNS_CACHE_TTL
+DNS_NEGATIVE_CACHE_TTL = cache_config.DNS_NEGATIVE_CACHE_TTL
+DNS_CACHE_SIZE = cache_config.DNS_CACHE_SIZE
+RESPONSE_CACHE_TTL = cache_config.RESPONSE_CACHE_TTL
+ETAG_CACHE_FILE = cache_config.ETAG_CACHE_FILE
+ETAG_CACHE_SIZE = cache_config.ETAG_CACHE_SIZE
+
 STYLE_CONFIG = ui_config.STYLE_CONFIG
 AVAILABLE_INDICATOR = ui_config.AVAILABLE_INDICATOR
 TAKEN_INDICATOR = ui_config.TAKEN_INDICATOR
@@ -0,0 +1,102 @@
+"""
+Asynchronous DNS resolution using c-ares (via aiodns).
+"""
+import asyncio
+import socket
+from typing import Callable, Dict, Iterable, Optional, Union
+
+import aiodns
+
+from .config import MAX_CONCURRENT_REQUESTS
+
+# c-ares error codes that mean the name simply does not resolve
+NOT_FOUND_ERRORS = (aiodns.error.ARES_ENOTFOUND, aiodns.error.ARES_ENODATA)
+
+# Shared resolver, bound to the event loop it was created on
+_resolver: Optional[aiodns.DNSResolver] = None
+_resolver_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_resolver() -> aiodns.DNSResolver:
+    """
+    Get the shared c-ares resolver for the running event loop.
+    
+    The resolver is created lazily because it must be bound to the loop that
+    uses it, and each CLI invocation runs its own loop via asyncio.run().
+    
+    Returns:
+        The resolver for the current event loop
+    """
+    global _resolver, _resolver_loop
+    
+    loop = asyncio.get_running_loop()
+    if _resolver is None or _resolver_loop is not loop:
+        _resolver = aiodns.DNSResolver(loop=loop)
+        _resolver_loop = loop
+    return _resolver
+
+
+async def resolve(host: str) -> Optional[str]:
+    """
+    Resolve a host name to an IPv4 address.
+    
+    Args:
+        host: The host name to resolve
+        
+    Returns:
+        The first IPv4 address, or None if the name does not exist
+        
+    Raises:
+        aiodns.error.DNSError: For failures other than a missing name
+    """
+    try:
+        result = await get_resolver().getaddrinfo(host, family=socket.AF_INET)
+    except aiodns.error.DNSError as e:
+        if e.args and e.args[0] in NOT_FOUND_ERRORS:
+            return None
+        raise
+    
+    for node in result.nodes:
+        return node.addr[0].decode() if isinstance(node.addr[0], bytes) else node.addr[0]
+    return None
+
+
+async def resolve_many(
+    hosts: Iterable[str],
+    max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    on_progress: Optional[Callable[[int], None]] = None
+) -> Dict[str, Union[str, None, aiodns.error.DNSError]]:
+    """
+    Resolve many host names concurrently in a single batch of c-ares queries.
+    
+    Args:
+        hosts: Host names to resolve (duplicates are resolved once)
+        max_concurrent: Maximum number of queries in flight at once
+        on_progress: Optional callback receiving the number of newly finished lookups
+        
+    Returns:
+        Dict mapping each host to its IPv4 address, None if it does not
+        exist, or the DNSError raised for any other failure
+    """
+    unique_hosts = list(dict.fromkeys(hosts))
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def limited_resolve(host: str) -> Optional[str]:
+        try:
+            async with semaphore:
+                return await resolve(host)
+        finally:
+            if on_progress:
+                on_progress(1)
+    
+    outcomes = await asyncio.gather(
+        *(limited_resolve(host) for host in unique_hosts),
+        return_exceptions=True
+    )
+    
+    resolved: Dict[str, Union[str, None, aiodns.error.DNSError]] = {}
+    for host, outcome in zip(unique_hosts, outcomes):
+        if isinstance(outcome, BaseException) and not isinstance(outcome, aiodns.error.DNSError):
+            raise outcome
+        resolved[host] = outcome
+    return resolved
\ No newline at end of file
@@ -1,39 +1,320 @@
 """
 HTTP utilities for making API requests efficiently.
 """
+import os
 import time
+import atexit
 import asyncio
-import httpx
-import requests
-from typing import Dict, List, Tuple, Any, Optional
+import orjson
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Tuple, Any, Optional, Mapping
+from urllib.parse import urlsplit
 
-from ..utils.config import DEFAULT_HEADERS, REQUEST_DELAY, REQUEST_TIMEOUT, MAX_CONCURRENT_REQUESTS
+from ..utils.config import (
+    DEFAULT_HEADERS,
+    REQUEST_DELAY,
+    REQUEST_TIMEOUT,
+    MAX_CONCURRENT_REQUESTS,
+    REQUESTS_PER_SECOND,
+    MAX_RATE_LIMIT_WAIT,
+    RESPONSE_CACHE_TTL,
+    ETAG_CACHE_FILE,
+    ETAG_CACHE_SIZE
+)
+
+# httpx is imported where a request is made, so importing this module
+# (e.g. for the domain checker) doesn't pay for loading it
+if TYPE_CHECKING:
+    import httpx
+
+# Status codes worth caching; anything else is a transient error
+_CACHEABLE_STATUSES = (200, 404)
+
+
+def _cache_key(method: str, url: str) -> str:
+    """Key responses by method too, since a HEAD response carries no body."""
+    return url if method == "GET" else f"{method} {url}"
+
+
+class ResponseCache:
+    """Cache of API responses, revalidated with ETags once stale.
+    
+    Responses with an ETag are persisted between runs, so a repeat check can
+    be answered with an empty 304 Not Modified instead of a full response.
+    """
+    
+    def __init__(self, ttl: float = RESPONSE_CACHE_TTL, path: str = ETAG_CACHE_FILE):
+        """
+        Initialize the response cache.
+        
+        Args:
+            ttl: Seconds a response is served without contacting the server
+            path: JSON file the ETags are persisted to ("" to disable)
+        """
+        self.ttl = ttl
+        self.path = path
+        # url -> (etag, status_code, response_data, expires_at)
+        self._entries: Dict[str, Tuple[Optional[str], int, Dict[str, Any], float]] = {}
+        self._loaded = not path
+        self._dirty = False
+    
+    def _load(self) -> None:
+        """Load persisted ETags on first use; they start out stale."""
+        self._loaded = True
+        try:
+            with open(self.path, 'rb') as f:
+                persisted = orjson.loads(f.read())
+        except (OSError, ValueError):
+            # Missing or corrupt cache files just mean starting empty
+            return
+        
+        if not isinstance(persisted, dict):
+            return
+        
+        for url, entry in persisted.items():
+            # Skip anything that isn't a well-formed [etag, status_code, data] entry
+            if not isinstance(entry, list) or len(entry) != 3:
+                continue
+            etag, status_code, data = entry
+            if (
+                (etag is None or isinstance(etag, str))
+                and type(status_code) is int
+                and isinstance(data, dict)
+            ):
+                self._entries.setdefault(url, (etag, status_code, data, 0.0))
+    
+    def save(self) -> None:
+        """Persist the most recently stored ETags, if anything changed."""
+        if not self.path or not self._dirty:
+            return
+        
+        with_etags = [(url, entry) for url, entry in self._entries.items() if entry[0]]
+        persisted = {
+            url: (etag, status_code, data)
+            for url, (etag, status_code, data, _) in with_etags[-ETAG_CACHE_SIZE:]
+        }
+        
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(persisted))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError:
+            # The cache is an optimization; never fail a run over it
+            pass
+    
+    def get_fresh(self, url: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Get a cached response that is still within its TTL.
+        
+        Args:
+            url: The requested URL
+            
+        Returns:
+            Tuple of (status_code, response_data), or None if missing or stale
+        """
+        entry = self._entries.get(url)
+        if entry is None or time.monotonic() >= entry[3]:
+            return None
+        return entry[1], entry[2]
+    
+    def conditional_headers(self, url: str, headers: Mapping[str, str]) -> Mapping[str, str]:
+        """
+        Add an If-None-Match header when a stale entry has an ETag.
+        
+        Args:
+            url: The requested URL
+            headers: The headers to extend
+            
+        Returns:
+            The headers to send with the request
+        """
+        if not self._loaded:
+            self._load()
+        
+        entry = self._entries.get(url)
+        if entry is None or entry[0] is None:
+            return headers
+        return {**headers, "If-None-Match": entry[0]}
+    
+    def revalidate(self, url: str) -> Tuple[int, Dict[str, Any]]:
+        """
+        Refresh a cached entry after a 304 Not Modified response.
+        
+        Args:
+            url: The requested URL
+            
+        Returns:
+            Tuple of (status_code, response_data) from the cache
+        """
+        etag, status_code, data, _ = self._entries[url]
+        self._entries[url] = (etag, status_code, data, time.monotonic() + self.ttl)
+        return status_code, data
+    
+    def store(self, url: str, status_code: int, etag: Optional[str], data: Dict[str, Any]) -> None:
+        """
+        Cache a response if its status is a definitive answer.
+        
+        Args:
+            url: The requested URL
+            status_code: The response status code
+            etag: The response ETag header, if any
+            data: The parsed response data
+        """
+        if self.ttl <= 0 or status_code not in _CACHEABLE_STATUSES:
+            return
+        # Re-insert so the newest entries are the ones kept when saving
+        self._entries.pop(url, None)
+        self._entries[url] = (etag, status_code, data, time.monotonic() + self.ttl)
+        self._dirty = self._dirty or etag is not None
+
+
+# Shared cache for both the sync and async clients, saved at interpreter exit
+response_cache = ResponseCache()
+atexit.register(response_cache.save)
+
+
+class AsyncRateLimiter:
+    """Token-bucket rate limiter for async requests."""
+    
+    def __init__(self, rate: float = REQUESTS_PER_SECOND, capacity: Optional[float] = None):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate: Tokens added per second (sustained requests per second);
+                0 or less means no limit beyond pauses from rate-limit headers
+            capacity: Maximum tokens held at once (burst size), defaults to max(1, rate)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                
+                if self.rate <= 0:
+                    # Unlimited: only an exhausted quota (see update_from_headers) holds requests
+                    return
+                
+                # Refill for the time elapsed since the last admission
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        """Acquire a token on entering an ``async with`` block."""
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Tokens are not returned, so there is nothing to release."""
+    
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Pause admissions when the server reports an exhausted rate limit.
+        
+        Uses GitHub's X-RateLimit-Remaining/X-RateLimit-Reset headers. Pauses
+        longer than MAX_RATE_LIMIT_WAIT are skipped so the CLI never stalls
+        for the whole hourly window; those requests fail fast instead.
+        
+        Args:
+            headers: Response headers from the rate-limited host
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        
+        try:
+            exhausted = int(remaining) <= 0
+            wait = float(reset) - time.time()
+        except ValueError:
+            return
+        
+        if exhausted and 0 < wait <= MAX_RATE_LIMIT_WAIT:
+            self.paused_until = max(self.paused_until, time.monotonic() + wait)
+
+
+# Pooled client for synchronous requests, created on first use
+_sync_client: Optional["httpx.Client"] = None
+
+
+def _get_sync_client() -> "httpx.Client":
+    """
+    Get the pooled synchronous client, creating it on first use.
+    
+    Returns:
+        The shared client, closed automatically at interpreter exit
+    """
+    global _sync_client
+    
+    if _sync_client is None:
+        import httpx
+        
+        _sync_client = httpx.Client(timeout=REQUEST_TIMEOUT, http2=True)
+        atexit.register(_sync_client.close)
+    return _sync_client
 
 
 class HTTPClient:
     """HTTP client for making both synchronous and asynchronous requests."""
     
     @staticmethod
-    def make_request(url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, Any]]:
+    def make_request(
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        method: str = "GET"
+    ) -> Tuple[int, Dict[str, Any]]:
         """
-        Make a synchronous HTTP request with rate limiting.
+        Make a synchronous HTTP request over a pooled keep-alive connection.
         
         Args:
             url: The URL to request
             headers: Optional custom headers
+            method: HTTP method; use "HEAD" when only the status code matters
             
         Returns:
             Tuple of (status_code, response_data)
         """
+        key = _cache_key(method, url)
+        cached = response_cache.get_fresh(key)
+        if cached is not None:
+            return cached
+        
+        import httpx
+        
         try:
-            response = requests.get(
+            response = _get_sync_client().request(
+                method,
                 url,
-                headers=headers or DEFAULT_HEADERS,
-                timeout=REQUEST_TIMEOUT
+                headers=response_cache.conditional_headers(key, headers or DEFAULT_HEADERS)
             )
-            time.sleep(REQUEST_DELAY)  # Simple rate limiting
-            return response.status_code, response.json() if response.status_code == 200 else {}
-        except requests.exceptions.RequestException as e:
+            if REQUEST_DELAY > 0:
+                time.sleep(REQUEST_DELAY)  # Optional politeness delay
+            if response.status_code == 304:
+                return response_cache.revalidate(key)
+            
+            data = {}
+            if response.status_code == 200 and method != "HEAD" and response.content:
+                data = orjson.loads(response.content)
+            
+            response_cache.store(key, response.status_code, response.headers.get("ETag"), data)
+            return response.status_code, data
+        except httpx.RequestError as e:
             # Return an error code for request exceptions
             return 500, {"error": str(e)}
 
@@ -42,7 +323,7 @@ class AsyncRequestManager:
     """Manages asynchronous HTTP requests with rate limiting and concurrency control."""
     
     def __init__(self, max_concurrent: int = MAX_CONCURRENT_REQUESTS, 
-                 headers: Optional[Dict[str, str]] = None):
+                 headers: Optional[Mapping[str, str]] = None):
         """
         Initialize the async request manager.
         
@@ -50,53 +331,182 @@ class AsyncRequestManager:
             max_concurrent: Maximum number of concurrent requests
             headers: Custom headers to use for all requests
         """
+        self.max_concurrent = max_concurrent
         self.semaphore = asyncio.Semaphore(max_concurrent)
         self.headers = headers or DEFAULT_HEADERS
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._inflight: Dict[str, "asyncio.Future[Tuple[str, int, Dict[str, Any]]]"] = {}
+        self._limiters: Dict[str, AsyncRateLimiter] = {}
     
-    async def get(self, url: str) -> Tuple[str, int, Dict[str, Any]]:
+    def _get_client(self) -> "httpx.AsyncClient":
+        """
+        Get the pooled client, creating it on first use.
+        
+        Reusing one client keeps connections alive between requests, so only
+        the first request to a host pays for DNS, TCP and TLS setup.
+        
+        Returns:
+            The shared async client for this manager
+        """
+        if self._client is None or self._client.is_closed:
+            import httpx
+            
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=REQUEST_TIMEOUT,
+                http2=True,  # multiplex requests to the same host over one connection
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrent,
+                    max_keepalive_connections=self.max_concurrent
+                )
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the pooled client and its open connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self) -> "AsyncRequestManager":
+        """Open the pooled client for the duration of an ``async with`` block."""
+        self._get_client()
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the pooled client when leaving the ``async with`` block."""
+        await self.aclose()
+    
+    async def get(self, url: str, method: str = "GET") -> Tuple[str, int, Dict[str, Any]]:
         """
         Make an async HTTP request with rate limiting.
         
         Args:
             url: The URL to request
+            method: HTTP method; use "HEAD" when only the status code matters
+            
+        Returns:
+            Tuple of (url, status_code, response_data)
+        """
+        key = _cache_key(method, url)
+        cached = response_cache.get_fresh(key)
+        if cached is not None:
+            return (url, *cached)
+        
+        # Share one request between concurrent callers asking for the same URL
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(url, method))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(pending)
+    
+    def _get_limiter(self, url: str) -> AsyncRateLimiter:
+        """
+        Get the rate limiter for a URL's host, creating it on first use.
+        
+        Args:
+            url: The URL about to be requested
+            
+        Returns:
+            The rate limiter shared by all requests to that host
+        """
+        host = urlsplit(url).netloc
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = AsyncRateLimiter(capacity=self.max_concurrent)
+            self._limiters[host] = limiter
+        return limiter
+    
+    async def _fetch(self, url: str, method: str = "GET") -> Tuple[str, int, Dict[str, Any]]:
+        """
+        Send a single request for a URL and cache the response.
+        
+        Args:
+            url: The URL to request
+            method: HTTP method to send
             
         Returns:
             Tuple of (url, status_code, response_data)
         """
+        import httpx
+        
+        key = _cache_key(method, url)
+        limiter = self._get_limiter(url)
+        await limiter.acquire()  # Limit request rate per host
+        
         async with self.semaphore:  # Limit concurrent requests
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        url, 
-                        headers=self.headers,
-                        timeout=REQUEST_TIMEOUT
-                    )
-                    
-                    data = {}
-                    if response.status_code == 200:
-                        data = response.json()
-                    
-                    # Add a small delay for rate limiting
-                    await asyncio.sleep(REQUEST_DELAY)
-                    return url, response.status_code, data
+                response = await self._get_client().request(
+                    method,
+                    url,
+                    headers=response_cache.conditional_headers(key, {})
+                )
             except httpx.RequestError as e:
                 return url, 500, {"error": str(e)}
+            
+            limiter.update_from_headers(response.headers)
+            if response.status_code == 304:
+                status_code, data = response_cache.revalidate(key)
+            else:
+                status_code, data = response.status_code, {}
+                if status_code == 200 and method != "HEAD" and response.content:
+                    data = orjson.loads(response.content)
+                response_cache.store(key, status_code, response.headers.get("ETag"), data)
+        
+        if REQUEST_DELAY > 0:
+            # Optional politeness delay, taken after the concurrency slot is freed
+            await asyncio.sleep(REQUEST_DELAY)
+        return url, status_code, data
     
-    async def batch_get(self, urls: List[str]) -> List[Tuple[str, int, Dict[str, Any]]]:
+    async def batch_get(self, urls: List[str], method: str = "GET") -> List[Tuple[str, int, Dict[str, Any]]]:
         """
         Execute multiple requests concurrently with rate limiting.
         
         Args:
             urls: List of URLs to request
+            method: HTTP method to send for every URL
             
         Returns:
             List of (url, status_code, response_data) tuples
         """
-        tasks = [self.get(url) for url in urls]
+        tasks = [self.get(url, method) for url in urls]
         return await asyncio.gather(*tasks)
+    
+    async def batch_get_iter(
+        self,
+        urls: List[str],
+        method: str = "GET"
+    ) -> AsyncIterator[Tuple[str, int, Dict[str, Any]]]:
+        """
+        Execute multiple requests concurrently, yielding each response as it completes.
+        
+        Requests still pending when the consumer stops iterating (or is
+        cancelled, e.g. on Ctrl-C) are cancelled.
+        
+        Args:
+            urls: List of URLs to request
+            method: HTTP method to send for every URL
+            
+        Yields:
+            (url, status_code, response_data) tuples in completion order
+        """
+        tasks = [asyncio.ensure_future(self.get(url, method)) for url in urls]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
 
 
 # Exported compatibility functions
-def make_request(url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, Any]]:
+def make_request(
+    url: str,
+    headers: Optional[Mapping[str, str]] = None,
+    method: str = "GET"
+) -> Tuple[int, Dict[str, Any]]:
     """Make a synchronous HTTP request (wrapper for HTTPClient.make_request)."""
-    return HTTPClient.make_request(url, headers) 
\ No newline at end of file
+    return HTTPClient.make_request(url, headers, method) 
\ No newline at end of file
@@ -1,26 +1,146 @@
 import os
 import sys
 import platform
-import threading
-import time
-from typing import Dict, List, Any, Optional, Callable
-from rich.console import Console
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from typing import TYPE_CHECKING, ContextManager, Dict, Iterator, List, Any, Tuple, Union
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
 from rich.style import Style
 from rich.text import Text
-from rich.prompt import Prompt, Confirm
-from rich.live import Live
-from rich.layout import Layout
-from rich.align import Align
 from rich import box
 
 from ..utils.config import STYLE_CONFIG, AVAILABLE_INDICATOR, TAKEN_INDICATOR, ERROR_INDICATOR
+from ..checkers._result import Result
+
+# Progress bars, tables and live displays are imported where they are used,
+# so commands that never draw them (e.g. --version) skip loading them
+if TYPE_CHECKING:
+    from rich.progress import Progress, ProgressColumn
 
 # Create a single console instance for the application
 console = Console()
 
+# Checked once at import rather than on every clear
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Whether output goes to a terminal (honours Rich's FORCE_COLOR/TTY overrides).
+# Screen clears, the header banner and progress bars are skipped when it doesn't,
+# so piped or redirected output only carries the results
+_IS_TTY = console.is_terminal
+
+# Home the cursor, then clear the screen and the scrollback (like `clear`)
+_CLEAR_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
+# Header panels by title, built on first use (the same few titles repeat)
+_HEADER_PANELS: Dict[str, Panel] = {}
+
+# Footer shown under every menu
+_MENU_FOOTER = Text.assemble("\n", ("Navigation: Enter number or use Up/Down/W/S/J/K keys", "dim"))
+
+# Whether the console understands ANSI sequences yet; Windows consoles are
+# switched into VT mode on the first clear, so runs that never clear skip it
+_vt_enabled = not _IS_WINDOWS
+
+# Styles parsed once, so rendering large tables doesn't re-parse style strings
+_STYLES: Dict[str, Style] = {name: Style.parse(style) for name, style in STYLE_CONFIG.items()}
+
+# Status column style for each result category, indexed by Result.cat
+# (AVAILABLE, TAKEN, ERROR)
+_CATEGORY_STYLES = (_STYLES["available"], _STYLES["taken"], _STYLES["error"])
+
+# Summary panel heading and row labels; only the counts change per call
+_SUMMARY_HEADING = Text.assemble(("Summary:", "bold"))
+_SUMMARY_ROWS = (
+    ("Total checked", _STYLES["normal"]),
+    ("Available", _STYLES["available"]),
+    ("Taken", _STYLES["taken"]),
+    ("Errors", _STYLES["error"]),
+)
+
+# Status text for the HTTP codes with a fixed meaning; anything else is an error
+_STATUS_TEXT: Dict[int, str] = {
+    404: f"{AVAILABLE_INDICATOR} Available",
+    200: f"{TAKEN_INDICATOR} Taken",
+}
+
+# Menu keys are read one at a time, so navigation doesn't wait for Enter
+if sys.platform == "win32":
+    import msvcrt
+    
+    # Arrow keys arrive as a "\x00" or "\xe0" prefix followed by this code
+    _ARROW_KEYS = {"H": "KEY_UP", "P": "KEY_DOWN"}
+    
+    def _single_key_input() -> ContextManager[None]:
+        """The Windows console already hands over single keys; nothing to set up."""
+        return nullcontext()
+    
+    def _read_key() -> str:
+        """Read one key press from the console."""
+        key = msvcrt.getwch()
+        if key in ("\x00", "\xe0"):
+            return _ARROW_KEYS.get(msvcrt.getwch(), "")
+        if key == "\x03":
+            raise KeyboardInterrupt
+        if key == "\x1a":
+            raise EOFError
+        if key == "\x1b":
+            return "KEY_ESCAPE"
+        return key
+else:
+    import select
+    import termios
+    import tty
+    
+    # Arrow keys arrive as ESC followed by one of these (normal or application mode)
+    _ARROW_KEYS = {b"[A": "KEY_UP", b"OA": "KEY_UP", b"[B": "KEY_DOWN", b"OB": "KEY_DOWN"}
+    
+    @contextmanager
+    def _single_key_input() -> Iterator[None]:
+        """Put the terminal in cbreak mode, so keys arrive unechoed and without Enter."""
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        try:
+            yield
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    
+    def _read_key() -> str:
+        """Read one key press from stdin (inside _single_key_input)."""
+        fd = sys.stdin.fileno()
+        key = os.read(fd, 1)
+        if key == b"\x1b":
+            # A lone ESC is the Escape key; otherwise the rest of the sequence follows at once
+            if not select.select([fd], [], [], 0.05)[0]:
+                return "KEY_ESCAPE"
+            return _ARROW_KEYS.get(os.read(fd, 8), "")
+        if key in (b"", b"\x04"):
+            raise EOFError
+        return key.decode(errors="ignore")
+
+
+@lru_cache(maxsize=1)
+def _progress_columns() -> Tuple[Union[str, "ProgressColumn"], ...]:
+    """
+    Build the progress bar columns once and share them between progress bars.
+    
+    The columns only hold display settings (task state lives in the Progress),
+    so one set can serve every bar.
+    
+    Returns:
+        Columns to pass to Progress
+    """
+    from rich.progress import SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+    
+    return (
+        SpinnerColumn(),
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(bar_width=40, complete_style="green", finished_style="bold green"),
+        TaskProgressColumn(),
+        "[progress.percentage]{task.percentage:>3.0f}%",
+    )
+
 
 class TerminalUI:
     """Class for handling terminal UI operations with consistent styling."""
@@ -28,80 +148,84 @@ class TerminalUI:
     @staticmethod
     def clear_terminal() -> None:
         """Clear the terminal for a cleaner UI experience."""
-        if platform.system() == "Windows":
-            os.system("cls")
-        else:
-            os.system("clear")
+        global _vt_enabled
+        
+        if not _IS_TTY:
+            return
+        
+        if not _vt_enabled:
+            # Running an empty command once switches the console into VT mode
+            os.system("")
+            _vt_enabled = True
+        
+        sys.stdout.write(_CLEAR_SEQUENCE)
+        sys.stdout.flush()
 
     @staticmethod
     def print_header(title: str, clear: bool = True) -> None:
         """Print a styled header for the application."""
+        if not _IS_TTY:
+            return
+        
         if clear:
             TerminalUI.clear_terminal()
         
-        console.print("\n")
-        console.print(Panel(
-            Text(title, style=STYLE_CONFIG["header"], justify="center"), 
-            border_style=STYLE_CONFIG["header"],
-            box=box.DOUBLE
-        ))
+        panel = _HEADER_PANELS.get(title)
+        if panel is None:
+            panel = Panel(
+                Text(title, style=STYLE_CONFIG["header"], justify="center"), 
+                border_style=STYLE_CONFIG["header"],
+                box=box.DOUBLE
+            )
+            _HEADER_PANELS[title] = panel
+        
+        # Buffer the spacing and the panel into a single write
+        with console:
+            console.print("\n")
+            console.print(panel)
 
     @staticmethod
     def print_subheader(text: str) -> None:
         """Print a styled subheader."""
-        console.print(f"\n[{STYLE_CONFIG['subheader']}]{text}[/{STYLE_CONFIG['subheader']}]")
+        console.print(Text.assemble("\n", (text, _STYLES["subheader"])))
 
     @staticmethod
-    def print_result_table(results: List[Dict[str, Any]], title: str) -> None:
+    def print_result_table(results: List[Result], title: str) -> None:
         """Print results in a nicely formatted table."""
+        from rich.table import Table
+        
         table = Table(title=title, show_header=True, header_style="bold", box=box.ROUNDED)
         table.add_column("Name", style="cyan")
         table.add_column("Status", style="white")
         
         for result in results:
-            name = result["name"]
-            status = result["status"]
-            
-            if "Available" in status:
-                status_style = STYLE_CONFIG["available"]
-            elif "Taken" in status:
-                status_style = STYLE_CONFIG["taken"]
-            else:
-                status_style = STYLE_CONFIG["error"]
-                
-            table.add_row(name, Text(status, style=status_style))
+            table.add_row(result.name, Text(result.status, style=_CATEGORY_STYLES[result.cat]))
         
         console.print(table)
 
     @staticmethod
     def print_summary(total: int, available: int, taken: int, errors: int) -> None:
         """Print a summary of results."""
+        body = _SUMMARY_HEADING.copy()
+        for (label, style), count in zip(_SUMMARY_ROWS, (total, available, taken, errors)):
+            body.append(f"\n{label}: {count}", style=style)
+        
         console.print(Panel(
-            f"[bold]Summary:[/bold]\n"
-            f"[{STYLE_CONFIG['normal']}]Total checked: {total}[/{STYLE_CONFIG['normal']}]\n"
-            f"[{STYLE_CONFIG['available']}]Available: {available}[/{STYLE_CONFIG['available']}]\n"
-            f"[{STYLE_CONFIG['taken']}]Taken: {taken}[/{STYLE_CONFIG['taken']}]\n"
-            f"[{STYLE_CONFIG['error']}]Errors: {errors}[/{STYLE_CONFIG['error']}]",
+            body,
             title="Results",
             border_style=STYLE_CONFIG["info"],
             box=box.ROUNDED
         ))
 
     @staticmethod
-    def create_progress_bar() -> Progress:
+    def create_progress_bar() -> "Progress":
         """Create a custom progress bar with spinner for async operations."""
-        return Progress(
-            SpinnerColumn(),
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(bar_width=40, complete_style="green", finished_style="bold green"),
-            TaskProgressColumn(),
-            "[progress.percentage]{task.percentage:>3.0f}%",
-            console=console,
-            expand=True
-        )
+        from rich.progress import Progress
+        
+        return Progress(*_progress_columns(), console=console, expand=True, disable=not _IS_TTY)
     
     @staticmethod
-    def smart_menu(title: str, options: List[Dict[str, Any]]) -> str:
+    def smart_menu(title: str, options: List[Dict[str, Any]]) -> Any:
         """
         Display a menu that supports both keyboard navigation and number input.
         Compatible with both Windows and Mac/Linux.
@@ -113,103 +237,125 @@ class TerminalUI:
         Returns:
             The value of the selected option
         """
+        from rich.live import Live
+        
         TerminalUI.clear_terminal()
         selected = 0
         
-        def render_menu() -> str:
-            menu_text = f"[bold]{title}[/bold]\n\n"
-            for i, opt in enumerate(options):
-                style = "bold magenta" if i == selected else "cyan"
-                prefix = "→" if i == selected else " "
-                menu_text += f"{prefix} [bold]{i+1})[/bold] [{style}]{opt['name']}[/{style}]: {opt['description']}\n"
-            
-            menu_text += "\n[dim]Navigation: Enter number or use Up/Down/W/S/J/K keys[/dim]"
-            return menu_text
+        # Build every option line once, in both its plain and selected form,
+        # from styled spans rather than markup that would need parsing
+        title_text = Text.assemble((title, "bold"), "\n\n")
+        option_lines = [
+            (
+                Text.assemble("  ", (f"{i+1})", "bold"), " ", (opt["name"], "cyan"), f": {opt['description']}\n"),
+                Text.assemble("→ ", (f"{i+1})", "bold"), " ", (opt["name"], "bold magenta"), f": {opt['description']}\n")
+            )
+            for i, opt in enumerate(options)
+        ]
         
-        while True:
-            # Clear and redraw the menu
-            TerminalUI.clear_terminal()
-            console.print(Panel(
+        def render_menu() -> Text:
+            # Assemble the prebuilt lines in one pass into a fresh Text
+            return Text.assemble(
+                title_text,
+                *(highlighted if i == selected else plain for i, (plain, highlighted) in enumerate(option_lines)),
+                _MENU_FOOTER
+            )
+        
+        def render() -> Group:
+            parts: List[Any] = [Panel(
                 render_menu(),
                 title="Menu",
                 border_style=STYLE_CONFIG["info"],
                 box=box.ROUNDED
-            ))
-            
-            # Get input
-            console.print("[bold magenta]Your choice:[/bold magenta] ", end="")
-            
-            # Read user input
-            try:
-                key = console.input()
-                
-                # Numeric choice (direct selection)
-                if key.isdigit():
-                    idx = int(key) - 1
-                    if 0 <= idx < len(options):
-                        return options[idx]["value"]
+            )]
+            if notice:
+                parts.append(Text(notice, style="yellow"))
+            parts.append(Text.assemble(("Your choice:", "bold magenta"), f" {number}" if single_keys else "", end=""))
+            return Group(*parts)
+        
+        notice = ""
+        
+        # Read single key presses from a terminal; piped input falls back to whole lines
+        single_keys = sys.stdin.isatty()
+        key_input = _single_key_input() if single_keys else nullcontext()
+        number = ""  # digits typed so far in single-key mode
+        drawn = (selected, notice, number)
+        
+        def redraw() -> None:
+            # Keys that change nothing on screen (e.g. Up on the first option) cost
+            # no output; line input always redraws, as it erased the prompt line
+            nonlocal drawn
+            state = (selected, notice, number)
+            if state != drawn or not single_keys:
+                drawn = state
+                live.update(render(), refresh=True)
+        
+        # Draw the menu once, then redraw it in place after each key
+        with key_input, Live(render(), console=console, auto_refresh=False,
+                             redirect_stdout=False, redirect_stderr=False) as live:
+            while True:
+                # Read user input
+                try:
+                    if single_keys:
+                        key = _read_key()
+                        if key.isdigit():
+                            number += key
+                            # Wait for another digit only while one could still fit
+                            if int(number) * 10 <= len(options):
+                                redraw()
+                                continue
+                            key, number = number, ""
+                        elif key in ("\x7f", "\b"):
+                            number = number[:-1]
+                            redraw()
+                            continue
+                        elif number and key in ("\r", "\n"):
+                            key, number = number, ""
                     else:
-                        console.print("[yellow]Invalid option. Please try again.[/yellow]")
-                        time.sleep(1)
-                
-                # Arrow key navigation (special keys and alternatives)
-                elif key == "KEY_UP" or key.lower() == "w" or key == "k":
-                    selected = max(0, selected - 1)
-                elif key == "KEY_DOWN" or key.lower() == "s" or key == "j":
-                    selected = min(len(options) - 1, selected + 1)
-                elif key == "KEY_ENTER" or key == "\r" or key == "\n" or key == "":
-                    return options[selected]["value"]
-                
-                # Handle escape key or 'q' for cancellation
-                elif key == "KEY_ESCAPE" or key.lower() == "q":
-                    raise KeyboardInterrupt
+                        key = input(" ")
+                        if _IS_TTY:
+                            # Erase the echoed input so the redraw lands on the menu
+                            sys.stdout.write("\x1b[1A\x1b[2K")
+                            sys.stdout.flush()
+                    notice = ""
+                    
+                    # Numeric choice (direct selection)
+                    if key.isdigit():
+                        idx = int(key) - 1
+                        if 0 <= idx < len(options):
+                            return options[idx]["value"]
+                        else:
+                            notice = "Invalid option. Please try again."
                     
-            except KeyboardInterrupt:
-                console.print("[yellow]Operation cancelled by user[/yellow]")
-                sys.exit(0)
-            except Exception:
-                # For any other errors, just redraw the menu
-                continue
+                    # Arrow key navigation (special keys and alternatives)
+                    elif key == "KEY_UP" or key.lower() == "w" or key == "k":
+                        selected = max(0, selected - 1)
+                    elif key == "KEY_DOWN" or key.lower() == "s" or key == "j":
+                        selected = min(len(options) - 1, selected + 1)
+                    elif key == "KEY_ENTER" or key == "\r" or key == "\n" or key == "":
+                        return options[selected]["value"]
+                    
+                    # Handle escape key or 'q' for cancellation
+                    elif key == "KEY_ESCAPE" or key.lower() == "q":
+                        raise KeyboardInterrupt
+                    
+                    redraw()
+                        
+                except (KeyboardInterrupt, EOFError):
+                    live.stop()
+                    console.print("[yellow]Operation cancelled by user[/yellow]")
+                    sys.exit(0)
+                except Exception:
+                    # For any other errors, just redraw the menu
+                    continue
 
     @staticmethod
     def format_status(status_code: int, service_type: str = "Username") -> str:
         """Format status based on HTTP response code."""
-        if status_code == 404:
-            return f"{AVAILABLE_INDICATOR} Available"
-        elif status_code == 200:
-            return f"{TAKEN_INDICATOR} Taken"
-        else:
+        status = _STATUS_TEXT.get(status_code)
+        if status is None:
             return f"{ERROR_INDICATOR} Error ({status_code})"
-
-
-# Exported utility functions that maintain backward compatibility
-def clear_terminal():
-    """Clear the terminal (wrapper for TerminalUI.clear_terminal)."""
-    return TerminalUI.clear_terminal()
-
-def print_header(title: str, clear: bool = True):
-    """Print header (wrapper for TerminalUI.print_header)."""
-    return TerminalUI.print_header(title, clear)
-
-def print_subheader(text: str):
-    """Print subheader (wrapper for TerminalUI.print_subheader)."""
-    return TerminalUI.print_subheader(text)
-
-def print_result_table(results: List[Dict[str, Any]], title: str):
-    """Print result table (wrapper for TerminalUI.print_result_table)."""
-    return TerminalUI.print_result_table(results, title)
-
-def print_summary(total: int, available: int, taken: int, errors: int):
-    """Print summary (wrapper for TerminalUI.print_summary)."""
-    return TerminalUI.print_summary(total, available, taken, errors)
-
-def create_progress_bar():
-    """Create progress bar (wrapper for TerminalUI.create_progress_bar)."""
-    return TerminalUI.create_progress_bar()
-
-def format_status(status_code: int, service_type: str = "Username"):
-    """Format status (wrapper for TerminalUI.format_status)."""
-    return TerminalUI.format_status(status_code, service_type)
+        return status
 
 
 def interactive_menu(options: List[Dict[str, Any]]) -> str:
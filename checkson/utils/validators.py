@@ -0,0 +1,59 @@
+"""
+Local validation of names, so clearly invalid input never reaches the network.
+"""
+import re
+
+# GitHub usernames: alphanumerics and single hyphens, no leading or trailing hyphen
+_GITHUB_USERNAME_RE = re.compile(r"[a-zA-Z\d](?:[a-zA-Z\d]|-(?=[a-zA-Z\d])){0,38}")
+
+# GitHub repository names: alphanumerics, '.', '-' and '_'
+_GITHUB_REPO_RE = re.compile(r"[\w.-]{1,100}", re.ASCII)
+
+# A single DNS label (LDH rule), and a top-level domain that isn't all digits
+_DOMAIN_LABEL_RE = re.compile(r"[a-zA-Z\d](?:[a-zA-Z\d-]{0,61}[a-zA-Z\d])?")
+_TLD_RE = re.compile(r"(?!\d+$)[a-zA-Z\d][a-zA-Z\d-]{0,61}[a-zA-Z\d]")
+
+
+def is_valid_github_username(name: str) -> bool:
+    """
+    Check whether a string is a well-formed GitHub username or organization.
+    
+    Args:
+        name: The name to validate
+        
+    Returns:
+        True if GitHub would accept the name
+    """
+    return _GITHUB_USERNAME_RE.fullmatch(name) is not None
+
+
+def is_valid_github_repo(name: str) -> bool:
+    """
+    Check whether a string is a well-formed GitHub repository name.
+    
+    Args:
+        name: The repository name to validate
+        
+    Returns:
+        True if GitHub would accept the name
+    """
+    return name not in (".", "..") and _GITHUB_REPO_RE.fullmatch(name) is not None
+
+
+def is_valid_domain(domain: str) -> bool:
+    """
+    Check whether a string is a well-formed, fully qualified domain name.
+    
+    Args:
+        domain: The domain name to validate, in ASCII (IDNA) form
+        
+    Returns:
+        True if the name could be registered
+    """
+    if len(domain) > 253:
+        return False
+    
+    labels = domain.split(".")
+    if len(labels) < 2 or _TLD_RE.fullmatch(labels[-1]) is None:
+        return False
+    return all(_DOMAIN_LABEL_RE.fullmatch(label) for label in labels[:-1])
\ No newline at end of file
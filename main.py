@@ -4,22 +4,9 @@ Entry point for the Checkson application.
 Provides an interactive terminal UI when run directly.
 """
 import sys
-import os
-import typer
-import time
-from typing import List, Optional, Dict, Any
-import traceback
-from rich.traceback import install
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
 
-from checkson.cli.main import app
-from checkson.utils.terminal import console, TerminalUI
-from checkson.__init__ import __version__
-
-# Install rich traceback handler for better error reporting
-install(show_locals=False)
+# Everything else is imported once the mode is known: the menu doesn't load the
+# CLI (typer) until a command runs, and CLI runs skip rich.traceback and the menu
 
 
 class ChecksonApp:
@@ -68,30 +55,6 @@ class ChecksonApp:
             box=box.ROUNDED
         ))
     
-    def show_help(self):
-        """Show help information and return to menu."""
-        TerminalUI.clear_terminal()
-        os.system(f"{sys.executable} {__file__} --help")
-        
-        console.print("\n[bold cyan]Press Enter to return to the main menu...[/bold cyan]")
-        input()
-        self.run()
-    
-    def run_command(self, command: str):
-        """Run a Checkson command and handle return to menu."""
-        TerminalUI.clear_terminal()
-        cmd = f"{sys.executable} {__file__} {command} --interactive"
-        console.print(f"[dim]Running: {cmd}[/dim]\n")
-        
-        result = os.system(cmd)
-        if result != 0:
-            console.print(f"[bold yellow]Command completed with exit code {result}[/bold yellow]")
-        
-        # Ask if user wants to return to main menu
-        console.print("\n[bold cyan]Return to main menu? (y/n)[/bold cyan] ", end="")
-        response = input().lower()
-        return response == "" or response.startswith("y")
-    
     def exit_app(self):
         """Exit the application with a goodbye message."""
         console.print("[yellow]Goodbye! Thanks for using Checkson.[/yellow]")
@@ -110,30 +73,28 @@ class ChecksonApp:
         if choice == "exit":
             self.exit_app()
             return False
-        elif choice == "help":
-            self.show_help()
-            return True
-        else:
-            # Run the selected command
-            return self.run_command(choice)
+        
+        # Help and the check commands are shared with the CLI's own menu
+        from checkson.cli.main import run_menu_choice
+        
+        return run_menu_choice(choice)
     
     def run(self):
         """Run the interactive application main loop."""
         try:
-            # Show header and menu
-            self.show_header()
-            
-            # Get user selection
-            choice = TerminalUI.smart_menu("Please select an option:", self.menu_options)
-            
-            # Handle selection
-            should_continue = self.handle_menu_choice(choice)
+            # Loop back to the menu instead of recursing, so the stack stays flat
+            while True:
+                # Show header and menu
+                self.show_header()
+                
+                # Get user selection
+                choice = TerminalUI.smart_menu("Please select an option:", self.menu_options)
+                
+                # Handle selection
+                if not self.handle_menu_choice(choice):
+                    break
             
-            # Continue if needed
-            if should_continue:
-                self.run()
-            else:
-                self.exit_app()
+            self.exit_app()
                 
         except KeyboardInterrupt:
             # Handle Ctrl+C gracefully
@@ -149,6 +110,19 @@ class ChecksonApp:
 # Function to run the interactive mode (callable from other modules)
 def run_interactive_mode():
     """Run the application in interactive mode with a menu-based UI."""
+    # Load the menu's dependencies once; the ChecksonApp methods use them as globals
+    global time, Panel, Text, box, console, TerminalUI, __version__
+    import time
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+    from rich.traceback import install
+    from checkson.utils.terminal import console, TerminalUI
+    from checkson.__init__ import __version__
+    
+    # Install rich traceback handler for better error reporting
+    install(show_locals=False)
+    
     app_instance = ChecksonApp()
     app_instance.run()
 
@@ -161,12 +135,15 @@ def main():
             run_interactive_mode()
         else:
             # Otherwise, pass control to the Typer app
+            from checkson.cli.main import app
             app()
     except KeyboardInterrupt:
         # Handle Ctrl+C gracefully
+        from checkson.utils.terminal import console
         console.print("\n[yellow]Operation cancelled. Goodbye![/yellow]")
         sys.exit(0)
     except Exception as e:
+        from checkson.utils.terminal import console
         console.print(f"\n[bold red]An error occurred:[/bold red] {str(e)}")
         sys.exit(1)
 
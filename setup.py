@@ -1,10 +1,25 @@
 """
 This setup.py file is provided for backward compatibility with older pip versions.
 Modern installations should use pyproject.toml.
+
+Set CHECKSON_USE_MYPYC=1 (with mypy installed) to compile the checker modules
+with mypyc, e.g. `CHECKSON_USE_MYPYC=1 pip install --no-build-isolation .`
 """
+import os
 
 from setuptools import setup
 
+# Optionally compile the per-item checker hot paths to C extensions
+ext_modules = []
+if os.getenv("CHECKSON_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    
+    ext_modules = mypycify([
+        "checkson/checkers/_result.py",
+        "checkson/checkers/github.py",
+        "checkson/checkers/domains.py",
+    ])
+
 # Forward to setuptools.build_meta
 if __name__ == "__main__":
-    setup() 
\ No newline at end of file
+    setup(ext_modules=ext_modules)
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""
+Tests for the CLI's de-duplication and result merging helpers.
+"""
+from checkson.checkers._result import AVAILABLE, ERROR, TAKEN, Result
+from checkson.cli.main import _canonical_github_name, _fan_out, _merge_invalid, _tally
+
+
+def test_merge_invalid_keeps_key_order():
+    keys = ["bad-", "alice", "-bad", "bob"]
+    checked = ["alice", "bob"]
+    results = [Result("alice", "Taken", TAKEN), Result("bob", "Available", AVAILABLE)]
+    
+    merged = _merge_invalid(keys, checked, results)
+    
+    assert [r.name for r in merged] == keys
+    assert [r.cat for r in merged] == [ERROR, TAKEN, ERROR, AVAILABLE]
+
+
+def test_fan_out_gives_one_row_per_input():
+    inputs = ["Alice", "bob", "alice", "ALICE"]
+    keys = [_canonical_github_name(name) for name in inputs]
+    results = [Result("alice", "Taken", TAKEN), Result("bob", "Available", AVAILABLE)]
+    
+    rows = _fan_out(results, keys, inputs)
+    
+    assert [r.name for r in rows] == inputs
+    assert [r.cat for r in rows] == [TAKEN, AVAILABLE, TAKEN, TAKEN]
+
+
+def test_tally_counts_each_category():
+    results = [Result("a", "", AVAILABLE), Result("b", "", TAKEN), Result("c", "", AVAILABLE), Result("d", "", ERROR)]
+    
+    assert _tally(results) == (2, 1, 1)
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Tests for the domain checker's LRU/TTL cache of DNS outcomes.
+"""
+import socket
+import time
+from collections import OrderedDict
+
+import aiodns
+import pytest
+
+from checkson.checkers import domains
+from checkson.checkers._result import AVAILABLE, ERROR, TAKEN
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    """Start each test with an empty cache and a fake monotonic clock at 0."""
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(domains, "DNS_CACHE_TTL", 300.0)
+    monkeypatch.setattr(domains, "DNS_NEGATIVE_CACHE_TTL", 60.0)
+    monkeypatch.setattr(domains, "_DNS_CACHE", OrderedDict())
+    return now
+
+
+def test_negative_results_expire_before_positive_ones(clock):
+    domains._cache_put("taken.com", True)
+    domains._cache_put("free.com", False)
+    
+    clock[0] = 59.0
+    assert domains._cache_get("taken.com") is True
+    assert domains._cache_get("free.com") is False
+    
+    clock[0] = 60.0
+    assert domains._cache_get("free.com") is None
+    assert domains._cache_get("taken.com") is True
+    
+    clock[0] = 300.0
+    assert domains._cache_get("taken.com") is None
+    # Expired entries are dropped, not just hidden
+    assert not domains._DNS_CACHE
+
+
+def test_zero_ttl_disables_caching(monkeypatch):
+    monkeypatch.setattr(domains, "DNS_NEGATIVE_CACHE_TTL", 0.0)
+    domains._cache_put("free.com", False)
+    
+    assert domains._cache_get("free.com") is None
+
+
+def test_least_recently_used_entry_is_evicted(monkeypatch):
+    monkeypatch.setattr(domains, "DNS_CACHE_SIZE", 2)
+    domains._cache_put("a.com", True)
+    domains._cache_put("b.com", True)
+    # Reading a.com makes b.com the least recently used entry
+    assert domains._cache_get("a.com") is True
+    
+    domains._cache_put("c.com", False)
+    
+    assert list(domains._DNS_CACHE) == ["a.com", "c.com"]
+    assert domains._cache_get("b.com") is None
+
+
+def test_nxdomain_from_getaddrinfo_is_cached(monkeypatch):
+    def getaddrinfo(*args):
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+    
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    
+    assert domains.check_domain("free.com").cat == AVAILABLE
+    assert domains._cache_get("free.com") is False
+
+
+def test_getaddrinfo_failures_are_never_cached(monkeypatch):
+    def getaddrinfo(*args):
+        raise socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution")
+    
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    
+    assert domains.check_domain("example.com").cat == ERROR
+    assert not domains._DNS_CACHE
+
+
+def test_resolver_errors_are_never_cached():
+    error = aiodns.error.DNSError(aiodns.error.ARES_ETIMEOUT, "Timeout while contacting DNS servers")
+    
+    result = domains._lookup_result("example.com", error)
+    
+    assert result.cat == ERROR
+    assert "Timeout" in result.status
+    assert not domains._DNS_CACHE
+
+
+def test_resolver_outcomes_are_cached():
+    assert domains._lookup_result("taken.com", "93.184.216.34").cat == TAKEN
+    assert domains._lookup_result("free.com", None).cat == AVAILABLE
+    
+    assert domains._cache_get("taken.com") is True
+    assert domains._cache_get("free.com") is False
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+Tests for the token-bucket rate limiter used by async requests.
+"""
+import asyncio
+import time
+
+import pytest
+
+from checkson.utils import http
+from checkson.utils.http import AsyncRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic/wall clocks that only move when the limiter sleeps."""
+    now = [1000.0]
+    sleeps = []
+    
+    async def sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+    
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    monkeypatch.setattr(http.asyncio, "sleep", sleep)
+    return now, sleeps
+
+
+def _acquire(limiter, times):
+    async def run():
+        for _ in range(times):
+            await limiter.acquire()
+    asyncio.run(run())
+
+
+def test_burst_is_admitted_then_tokens_refill_at_the_rate(clock):
+    now, sleeps = clock
+    limiter = AsyncRateLimiter(rate=2, capacity=2)
+    
+    _acquire(limiter, 2)
+    assert sleeps == []
+    
+    # The bucket is empty, so the next request waits for one token at 2/s
+    _acquire(limiter, 1)
+    assert sleeps == [pytest.approx(0.5)]
+    
+    # Idle time refills the bucket, but never beyond its capacity
+    now[0] += 60
+    _acquire(limiter, 2)
+    assert len(sleeps) == 1
+
+
+def test_unlimited_rate_never_waits(clock):
+    _, sleeps = clock
+    
+    _acquire(AsyncRateLimiter(rate=0), 100)
+    
+    assert sleeps == []
+
+
+def test_exhausted_quota_pauses_until_the_reset(clock):
+    now, sleeps = clock
+    limiter = AsyncRateLimiter(rate=0)
+    
+    limiter.update_from_headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(now[0] + 10)})
+    _acquire(limiter, 1)
+    
+    assert sleeps == [pytest.approx(10)]
+
+
+@pytest.mark.parametrize("headers", [
+    {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "1010"},
+    {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "999999"},
+    {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "soon"},
+    {"X-RateLimit-Remaining": "0"},
+])
+def test_remaining_quota_or_unusable_resets_do_not_pause(clock, headers):
+    _, sleeps = clock
+    limiter = AsyncRateLimiter(rate=0)
+    
+    limiter.update_from_headers(headers)
+    _acquire(limiter, 1)
+    
+    assert sleeps == []
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+Tests for the ETag-aware response cache.
+"""
+import time
+
+import orjson
+import pytest
+
+from checkson.utils.http import ResponseCache
+
+URL = "HEAD https://api.github.com/users/octocat"
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "etag.json"
+
+
+def test_fresh_entries_are_served_until_the_ttl_expires(cache_path, monkeypatch):
+    cache = ResponseCache(ttl=60, path=str(cache_path))
+    cache.store(URL, 200, '"abc"', {})
+    
+    assert cache.get_fresh(URL) == (200, {})
+    
+    monkeypatch.setattr(time, "monotonic", lambda: float("inf"))
+    assert cache.get_fresh(URL) is None
+
+
+def test_uncacheable_statuses_are_not_stored(cache_path):
+    cache = ResponseCache(ttl=60, path=str(cache_path))
+    cache.store(URL, 500, '"abc"', {})
+    
+    assert cache.get_fresh(URL) is None
+
+
+def test_etags_round_trip_through_the_cache_file(cache_path):
+    cache = ResponseCache(ttl=60, path=str(cache_path))
+    cache.store(URL, 404, '"abc"', {})
+    cache.store("https://api.github.com/users/no-etag", 200, None, {})
+    cache.save()
+    
+    assert orjson.loads(cache_path.read_bytes()) == {URL: ['"abc"', 404, {}]}
+    
+    reloaded = ResponseCache(ttl=60, path=str(cache_path))
+    # Persisted entries start out stale, so they are revalidated rather than served
+    assert reloaded.get_fresh(URL) is None
+    assert reloaded.conditional_headers(URL, {"Accept": "x"}) == {"Accept": "x", "If-None-Match": '"abc"'}
+    
+    # A 304 refreshes the entry with the persisted status
+    assert reloaded.revalidate(URL) == (404, {})
+    assert reloaded.get_fresh(URL) == (404, {})
+
+
+def test_save_is_skipped_when_nothing_changed(cache_path):
+    ResponseCache(ttl=60, path=str(cache_path)).save()
+    
+    assert not cache_path.exists()
+
+
+@pytest.mark.parametrize("content", [
+    b"not json",
+    b"[1, 2]",
+    b"null",
+    b'{"' + URL.encode() + b'": [1, 2]}',
+    b'{"' + URL.encode() + b'": ["abc", "404", {}]}',
+    b'{"' + URL.encode() + b'": [1, 404, {}]}',
+    b'{"' + URL.encode() + b'": ["abc", 404, []]}',
+])
+def test_malformed_cache_files_are_ignored(cache_path, content):
+    cache_path.write_bytes(content)
+    cache = ResponseCache(ttl=60, path=str(cache_path))
+    
+    assert cache.conditional_headers(URL, {}) == {}
+
+
+def test_malformed_entries_do_not_hide_valid_ones(cache_path):
+    cache_path.write_bytes(orjson.dumps({"bad": [1, 2], URL: ['"abc"', 200, {}]}))
+    cache = ResponseCache(ttl=60, path=str(cache_path))
+    
+    assert cache.conditional_headers(URL, {}) == {"If-None-Match": '"abc"'}
+    assert cache.conditional_headers("bad", {}) == {}
\ No newline at end of file
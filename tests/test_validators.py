@@ -0,0 +1,59 @@
+"""
+Tests for the local name validators.
+"""
+import pytest
+
+from checkson.cli.main import _canonical_domain
+from checkson.utils.validators import is_valid_domain, is_valid_github_repo, is_valid_github_username
+
+
+@pytest.mark.parametrize("name", ["a", "octocat", "Octo-Cat", "a-b-c", "0", "a" * 39])
+def test_valid_github_usernames(name):
+    assert is_valid_github_username(name)
+
+
+@pytest.mark.parametrize("name", ["", "-octocat", "octocat-", "octo--cat", "octo_cat", "octo.cat", "a" * 40, "ünïcode"])
+def test_invalid_github_usernames(name):
+    assert not is_valid_github_username(name)
+
+
+@pytest.mark.parametrize("name", ["checkson", "my.repo", "my-repo_2", ".github", "a" * 100])
+def test_valid_github_repos(name):
+    assert is_valid_github_repo(name)
+
+
+@pytest.mark.parametrize("name", ["", ".", "..", "my repo", "repo/name", "répo", "a" * 101])
+def test_invalid_github_repos(name):
+    assert not is_valid_github_repo(name)
+
+
+@pytest.mark.parametrize("domain", ["example.com", "sub.example.co.uk", "a-b.io", "xn--bcher-kva.de", "123.example.com"])
+def test_valid_domains(domain):
+    assert is_valid_domain(domain)
+
+
+@pytest.mark.parametrize("domain", [
+    "",
+    ".",
+    "..",
+    "localhost",
+    "example..com",
+    ".example.com",
+    "-example.com",
+    "example-.com",
+    "example.123",
+    "1.2.3.4",
+    "example.c",
+    "exa_mple.com",
+    "a" * 64 + ".com",
+    ".".join(["a" * 63] * 4) + ".com",
+])
+def test_invalid_domains(domain):
+    assert not is_valid_domain(domain)
+
+
+def test_internationalized_domains_validate_in_idna_form():
+    # Validation runs on the canonical ASCII form the CLI produces
+    assert not is_valid_domain("bücher.de")
+    assert _canonical_domain("Bücher.DE.") == "xn--bcher-kva.de"
+    assert is_valid_domain(_canonical_domain("bücher.de"))
\ No newline at end of file